@@ -250,6 +250,7 @@ class Settings(QtCore.QSettings):
         'bibles/last directory import': None,
         'bibles/hide combined quick error': False,
         'bibles/is search while typing enabled': True,
+        'bibles/model manifest url': '',
         'crashreport/last directory': None,
         'custom/db type': 'sqlite',
         'custom/db username': '',
@@ -317,9 +318,12 @@ class Settings(QtCore.QSettings):
         'models/db password': '',
         'models/db hostname': '',
         'models/db database': '',
+        'models/embedding models table state': QtCore.QByteArray(),
         'models/encoder model': '',
         'models/transcriber model': '',
         'models/last directory download': None,
+        'models/last encoder fingerprint': '',
+        'models/transcription models table state': QtCore.QByteArray(),
         'players/background color': '#000000',
         'planningcenter/status': PluginStatus.Inactive,
         'planningcenter/application_id': '',
@@ -79,6 +79,7 @@ class BibleImportForm(OpenLPWizard):
         """
         self.manager = manager
         self.web_bible_list = {}
+        self.web_bible_names = {}
         super(BibleImportForm, self).__init__(parent, bible_plugin,
                                               'bibleImportWizard', ':/wizards/wizard_importbible.bmp')
 
@@ -568,9 +569,7 @@ class BibleImportForm(OpenLPWizard):
         """
         self.web_translation_combo_box.clear()
         if self.web_bible_list and index in self.web_bible_list:
-            bibles = list(self.web_bible_list[index].keys())
-            bibles.sort(key=get_locale_key)
-            self.web_translation_combo_box.addItems(bibles)
+            self.web_translation_combo_box.addItems(self.web_bible_names[index])
 
     def on_web_update_button_clicked(self):
         """
@@ -578,6 +577,7 @@ class BibleImportForm(OpenLPWizard):
         """
         # Download from Crosswalk, BiblesGateway, BibleServer
         self.web_bible_list = {}
+        self.web_bible_names = {}
         self.web_source_combo_box.setEnabled(False)
         self.web_translation_combo_box.setEnabled(False)
         self.web_update_button.setEnabled(False)
@@ -599,6 +599,8 @@ class BibleImportForm(OpenLPWizard):
                 self.web_bible_list[download_type] = {}
                 for (bible_name, bible_key, language_code) in bibles:
                     self.web_bible_list[download_type][bible_name] = (bible_key, language_code)
+                # Sort the names once here, rather than every time the web source is changed
+                self.web_bible_names[download_type] = sorted(self.web_bible_list[download_type], key=get_locale_key)
             self.web_progress_bar.setValue(download_type + 1)
         # Update combo box if something got into the list
         if self.web_bible_list:
@@ -21,24 +21,122 @@
 """
 The bible import functions for OpenLP
 """
+import hashlib
 import logging
+from dataclasses import asdict
 
 from PySide6 import QtCore, QtWidgets
 
 from openlp.core.common import trace_error_handler
 from openlp.core.common.applocation import AppLocation
-from openlp.core.common.i18n import UiStrings, get_locale_key, translate
+from openlp.core.common.i18n import UiStrings, translate
 from openlp.core.common.path import create_paths
 from openlp.core.lib.ui import critical_error_message_box
+from openlp.core.threading import run_thread
 from openlp.core.widgets.enums import PathEditType
 from openlp.core.widgets.edits import PathEdit
 from openlp.core.widgets.wizard import OpenLPWizard, WizardStrings
 from openlp.plugins.bibles.lib.db import clean_filename
-from openlp.plugins.bibles.lib import ModelInfo, ModelType, get_size_from_string
+from openlp.plugins.bibles.lib import ModelInfo, ModelType
+from openlp.plugins.bibles.lib.model import ModelDownloadWorker
 
 
 log = logging.getLogger(__name__)
 
+# Default widths of the Name, Description, Speed, Performance and Size columns of the model tables
+MODEL_TABLE_COLUMN_WIDTHS = (220, 400, 100, 120, 100)
+
+
+class ModelsTableModel(QtCore.QAbstractTableModel):
+    """
+    A lightweight, read-only table model over one of the :class:`ModelInfo` model dictionaries.
+    """
+    column_count = 5
+
+    def __init__(self, models=None, parent=None):
+        """
+        Constructor
+
+        :param models: A dictionary of model names to model information, e.g. ``ModelInfo.embedding_models``.
+        :param parent: The parent QObject.
+        """
+        super().__init__(parent)
+        self._rows = self._build_rows(models) if models else []
+        self._header_labels = [''] * self.column_count
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self.column_count
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (QtCore.Qt.ItemDataRole.DisplayRole,
+                                               QtCore.Qt.ItemDataRole.EditRole):
+            return None
+        return self._rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if orientation == QtCore.Qt.Orientation.Horizontal and role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self._header_labels[section]
+        return super().headerData(section, orientation, role)
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        """
+        Sort the rows in place, keeping any persistent indexes (such as the selection) pointing at the same rows.
+
+        :param column: The column to sort by.
+        :param order: The sort order.
+        """
+        self.layoutAboutToBeChanged.emit()
+        order_map = sorted(range(len(self._rows)), key=lambda row: self._rows[row][column],
+                           reverse=order == QtCore.Qt.SortOrder.DescendingOrder)
+        new_positions = {old_row: new_row for new_row, old_row in enumerate(order_map)}
+        self._rows = [self._rows[old_row] for old_row in order_map]
+        old_indexes = self.persistentIndexList()
+        new_indexes = [self.index(new_positions[index.row()], index.column()) for index in old_indexes]
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+    def set_models(self, models):
+        """
+        Replace all the rows of the table in a single model reset.
+
+        :param models: A dictionary of model names to model data.
+        """
+        self.beginResetModel()
+        self._rows = self._build_rows(models)
+        self.endResetModel()
+
+    def set_header_labels(self, labels):
+        """
+        Set the horizontal header labels.
+
+        :param labels: A list of labels, one per column.
+        """
+        self._header_labels = list(labels)
+        self.headerDataChanged.emit(QtCore.Qt.Orientation.Horizontal, 0, len(self._header_labels) - 1)
+
+    def get_model_name(self, row):
+        """
+        Get the name of the model displayed in a row.
+
+        :param row: The row number.
+        :return: The model name.
+        """
+        return self._rows[row][0]
+
+    @staticmethod
+    def _build_rows(models):
+        """
+        Flatten the model information into one tuple per row, so that painting a cell is a single index operation.
+
+        :param models: A dictionary of model names to :class:`ModelSpec` objects.
+        :return: A list of (name, description, speed, performance, size) tuples.
+        """
+        return [(model_name, model_spec.description, model_spec.speed, model_spec.performance, model_spec.size_mb)
+                for model_name, model_spec in models.items()]
+
 
 class ModelDownloadForm(OpenLPWizard):
     """
@@ -55,7 +153,6 @@ class ModelDownloadForm(OpenLPWizard):
         :param bible_plugin: The Bible plugin.
         """
         self.manager = manager
-        self.web_bible_list = {}
         super(ModelDownloadForm, self).__init__(parent, bible_plugin,
                                                 'modelDownloadWizard', ':/wizards/wizard_downloadmodel.bmp')
 
@@ -72,7 +169,7 @@ class ModelDownloadForm(OpenLPWizard):
         the import is available and accordingly to disable or enable the next
         button.
         """
-        self.select_stack.setCurrentIndex(index)
+        self._show_models_page(index)
 
     def custom_init(self):
         """
@@ -80,7 +177,6 @@ class ModelDownloadForm(OpenLPWizard):
         """
         self.manager.set_process_dialog(self)
         self.restart()
-        self.select_stack.setCurrentIndex(0)
 
     def custom_signals(self):
         """
@@ -102,85 +198,23 @@ class ModelDownloadForm(OpenLPWizard):
         self.model_type_label = QtWidgets.QLabel(self.select_page)
         self.model_type_label.setObjectName('ModelTypeLabel')
         self.model_type_combo_box = QtWidgets.QComboBox(self.select_page)
-        self.model_type_combo_box.addItems(['', ''])
         self.model_type_combo_box.setObjectName('ModelTypeComboBox')
         self.model_type_layout.addRow(self.model_type_label, self.model_type_combo_box)
-        self.spacer = QtWidgets.QSpacerItem(10, 0, QtWidgets.QSizePolicy.Policy.Fixed,
-                                            QtWidgets.QSizePolicy.Policy.Minimum)
-        self.model_type_layout.setItem(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.spacer)
+        self.select_spacer = QtWidgets.QSpacerItem(10, 0, QtWidgets.QSizePolicy.Policy.Fixed,
+                                                   QtWidgets.QSizePolicy.Policy.Minimum)
+        self.model_type_layout.setItem(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.select_spacer)
         self.select_page_layout.addLayout(self.model_type_layout)
         self.select_stack = QtWidgets.QStackedLayout()
         self.select_stack.setObjectName('SelectStack')
-        self.embedding_models_widget = QtWidgets.QWidget(self.select_page)
-        self.embedding_models_widget.setObjectName('EmbeddingModelsWidget')
-        self.embedding_models_layout = QtWidgets.QFormLayout(self.embedding_models_widget)
-        self.embedding_models_layout.setObjectName('EmbeddingModelsLayout')
-        self.embedding_models_table = QtWidgets.QTableWidget(self.embedding_models_widget)
-        self.embedding_models_table.setObjectName('EmbeddingModelsTable')
-        self.embedding_models_table.setColumnCount(5)
-        self.embedding_models_table.setRowCount(0)
-        self.embedding_models_table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.embedding_models_table.setAlternatingRowColors(True)
-        self.embedding_models_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.embedding_models_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.embedding_models_table.setSortingEnabled(True)
-        self.embedding_models_table.horizontalHeader().setSortIndicator(0, QtCore.Qt.SortOrder.AscendingOrder)
-        self.embedding_models_table.horizontalHeader().setSortIndicator(4, QtCore.Qt.SortOrder.AscendingOrder)
-        self.embedding_models_table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        self.embedding_models_table.horizontalHeader().setSectionResizeMode(
-            1, QtWidgets.QHeaderView.ResizeMode.Interactive)
-        self.embedding_models_table.horizontalHeader().setDefaultSectionSize(250)
-        self.embedding_models_table.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        item = QtWidgets.QTableWidgetItem()
-        self.embedding_models_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.embedding_models_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.embedding_models_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.embedding_models_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.embedding_models_table.setHorizontalHeaderItem(4, item)
-        self.embedding_models_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.SpanningRole,
-                                               self.embedding_models_table)
-        self.select_stack.addWidget(self.embedding_models_widget)
-        self.transcription_models_widget = QtWidgets.QWidget(self.select_page)
-        self.transcription_models_widget.setObjectName('TranscriptionModelsWidget')
-        self.transcription_models_layout = QtWidgets.QFormLayout(self.transcription_models_widget)
-        self.transcription_models_layout.setObjectName('TranscriptionModelsLayout')
-        self.transcription_models_table = QtWidgets.QTableWidget(self.transcription_models_widget)
-        self.transcription_models_table.setObjectName('TranscriptionModelsTable')
-        self.transcription_models_table.setColumnCount(5)
-        self.transcription_models_table.setRowCount(0)
-        self.transcription_models_table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
-        self.transcription_models_table.setAlternatingRowColors(True)
-        self.transcription_models_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
-        self.transcription_models_table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
-        self.transcription_models_table.setSortingEnabled(True)
-        self.transcription_models_table.horizontalHeader().setSortIndicator(0, QtCore.Qt.SortOrder.AscendingOrder)
-        self.transcription_models_table.horizontalHeader().setSortIndicator(4, QtCore.Qt.SortOrder.AscendingOrder)
-        self.transcription_models_table.horizontalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        self.transcription_models_table.horizontalHeader().setSectionResizeMode(
-            1, QtWidgets.QHeaderView.ResizeMode.Interactive)
-        self.transcription_models_table.horizontalHeader().setDefaultSectionSize(250)
-        self.transcription_models_table.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents)
-        item = QtWidgets.QTableWidgetItem()
-        self.transcription_models_table.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.transcription_models_table.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.transcription_models_table.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.transcription_models_table.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.transcription_models_table.setHorizontalHeaderItem(4, item)
-        self.transcription_models_layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.SpanningRole,
-                                                   self.transcription_models_table)
-        self.select_stack.addWidget(self.transcription_models_widget)
+        # The model pages are only built when they are first shown, see _show_models_page()
+        self.embedding_models_widget = None
+        self.embedding_models_table = None
+        self.transcription_models_widget = None
+        self.transcription_models_table = None
+        self._model_page_builders = {ModelType.ENCODER.value: self._build_embedding_models_page,
+                                     ModelType.TRANSCRIBER.value: self._build_transcription_models_page}
+        self.select_stack.addWidget(QtWidgets.QWidget(self.select_page))
+        self.select_stack.addWidget(QtWidgets.QWidget(self.select_page))
         self.select_page_layout.addLayout(self.select_stack)
         self.addPage(self.select_page)
         # Download Location Page
@@ -203,27 +237,114 @@ class ModelDownloadForm(OpenLPWizard):
         )
         self.download_location_edit.setObjectName('DownloadLocationEdit')
         self.download_location_layout.addRow(self.download_location_label, self.download_location_edit)
-        self.download_location_layout.setItem(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.spacer)
+        self.download_spacer = QtWidgets.QSpacerItem(10, 0, QtWidgets.QSizePolicy.Policy.Fixed,
+                                                     QtWidgets.QSizePolicy.Policy.Minimum)
+        self.download_location_layout.setItem(1, QtWidgets.QFormLayout.ItemRole.LabelRole, self.download_spacer)
         self.addPage(self.download_location_page)
 
+    def _build_models_page(self, object_name, models, state_setting):
+        """
+        Build a page of the select stack, containing a table of models.
+
+        :param object_name: The prefix of the object names of the page's widgets, e.g. ``EmbeddingModels``.
+        :param models: The models to populate the table with.
+        :param state_setting: The setting in which the column widths and sort order of the table are saved.
+        :return: A tuple of the page widget and its table.
+        """
+        widget = QtWidgets.QWidget(self.select_page)
+        widget.setObjectName('{name}Widget'.format(name=object_name))
+        layout = QtWidgets.QFormLayout(widget)
+        layout.setObjectName('{name}Layout'.format(name=object_name))
+        table = QtWidgets.QTableView(widget)
+        table.setObjectName('{name}Table'.format(name=object_name))
+        table.setModel(ModelsTableModel(parent=table))
+        table.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
+        table.horizontalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
+        # Restore the column widths and sort order from the last time the wizard was used, if there are any
+        header_state = self.settings.value(state_setting)
+        if not header_state or not table.horizontalHeader().restoreState(header_state):
+            for column, width in enumerate(MODEL_TABLE_COLUMN_WIDTHS):
+                table.horizontalHeader().resizeSection(column, width)
+            table.horizontalHeader().setSortIndicator(4, QtCore.Qt.SortOrder.AscendingOrder)
+        table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Fixed)
+        table.verticalHeader().setDefaultSectionSize(table.fontMetrics().height() + 6)
+        table.model().set_header_labels(self.model_table_header_labels)
+        layout.setWidget(0, QtWidgets.QFormLayout.ItemRole.SpanningRole, table)
+        self._populate_models_table(table, models)
+        return widget, table
+
+    def _build_embedding_models_page(self):
+        """
+        Build the page listing the embedding models.
+        """
+        self.embedding_models_widget, self.embedding_models_table = \
+            self._build_models_page('EmbeddingModels', ModelInfo.embedding_models,
+                                    'models/embedding models table state')
+        return self.embedding_models_widget
+
+    def _build_transcription_models_page(self):
+        """
+        Build the page listing the transcription models.
+        """
+        self.transcription_models_widget, self.transcription_models_table = \
+            self._build_models_page('TranscriptionModels', ModelInfo.transcription_models,
+                                    'models/transcription models table state')
+        return self.transcription_models_widget
+
+    def _show_models_page(self, index):
+        """
+        Show a page of the select stack, building it first if this is the first time it is shown.
+
+        :param index: The index of the page, one of the ``ModelType`` values.
+        """
+        if index in self._model_page_builders:
+            page = self._model_page_builders.pop(index)()
+            placeholder = self.select_stack.widget(index)
+            self.select_stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self.select_stack.insertWidget(index, page)
+        self.select_stack.setCurrentIndex(index)
+
     def _populate_models_table(self, table, models):
         """
-        Populate the table with the models.
+        Populate the table with the models. Sorting and repainting are suspended while the model is reset, so the
+        table is only sorted (by the current sort indicator) and painted once.
 
         :param table: The table to populate.
         :param models: The models to populate the table with.
         """
-        table.setRowCount(len(models))
-        i = 0
-        for model_name, model_data in models.items():
-            table.setItem(i, 0, QtWidgets.QTableWidgetItem(model_name))
-            table.setItem(i, 1, QtWidgets.QTableWidgetItem(model_data['description']))
-            table.setItem(i, 2, QtWidgets.QTableWidgetItem(model_data['speed']))
-            table.setItem(i, 3, QtWidgets.QTableWidgetItem(model_data['performance']))
-            item = QtWidgets.QTableWidgetItem()
-            item.setData(QtCore.Qt.ItemDataRole.DisplayRole, get_size_from_string(model_data['size']))
-            table.setItem(i, 4, item)
-            i += 1
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.model().set_models(models)
+        table.setUpdatesEnabled(True)
+        table.setSortingEnabled(True)
+
+    def done(self, result):
+        """
+        Save the column widths and sort order of the model tables when the wizard is closed.
+
+        :param result: The result code of the wizard.
+        """
+        if self.embedding_models_table:
+            self.settings.setValue('models/embedding models table state',
+                                   self.embedding_models_table.horizontalHeader().saveState())
+        if self.transcription_models_table:
+            self.settings.setValue('models/transcription models table state',
+                                   self.transcription_models_table.horizontalHeader().saveState())
+        super(ModelDownloadForm, self).done(result)
+
+    def _get_selected_model_name(self, table):
+        """
+        Get the name of the model selected in a table.
+
+        :param table: The table to get the selected model from.
+        :return: The name of the selected model.
+        """
+        row = table.selectionModel().selectedRows()[0].row()
+        return table.model().get_model_name(row)
 
     def retranslate_ui(self):
         """
@@ -242,22 +363,22 @@ class ModelDownloadForm(OpenLPWizard):
         self.select_page.setSubTitle(translate('BiblesPlugin.ImportWizardForm',
                                                'Select the model type and the model to import.'))
         self.model_type_label.setText(translate('BiblesPlugin.ImportWizardForm', 'Model Type:'))
-        self.model_type_combo_box.setItemText(ModelType.ENCODER.value, translate('BiblesPlugin.ImportWizardForm',
-                                                                                 'Embedding Models'))
-        self.model_type_combo_box.setItemText(ModelType.TRANSCRIBER.value, translate('BiblesPlugin.ImportWizardForm',
-                                                                                     'Transcription Models'))
-        self.embedding_models_table.setHorizontalHeaderItem(0, QtWidgets.QTableWidgetItem('Name'))
-        self.embedding_models_table.setHorizontalHeaderItem(1, QtWidgets.QTableWidgetItem('Description'))
-        self.embedding_models_table.setHorizontalHeaderItem(2, QtWidgets.QTableWidgetItem('Speed'))
-        self.embedding_models_table.setHorizontalHeaderItem(3, QtWidgets.QTableWidgetItem('Performance'))
-        self.embedding_models_table.setHorizontalHeaderItem(4, QtWidgets.QTableWidgetItem('Size (MB)'))
-        self._populate_models_table(self.embedding_models_table, ModelInfo.embedding_models)
-        self.transcription_models_table.setHorizontalHeaderItem(0, QtWidgets.QTableWidgetItem('Name'))
-        self.transcription_models_table.setHorizontalHeaderItem(1, QtWidgets.QTableWidgetItem('Description'))
-        self.transcription_models_table.setHorizontalHeaderItem(2, QtWidgets.QTableWidgetItem('Speed'))
-        self.transcription_models_table.setHorizontalHeaderItem(3, QtWidgets.QTableWidgetItem('Performance'))
-        self.transcription_models_table.setHorizontalHeaderItem(4, QtWidgets.QTableWidgetItem('Size (MB)'))
-        self._populate_models_table(self.transcription_models_table, ModelInfo.transcription_models)
+        # Replace the items in one go, keeping the current selection and without triggering the change handlers
+        current_index = max(self.model_type_combo_box.currentIndex(), 0)
+        self.model_type_combo_box.blockSignals(True)
+        self.model_type_combo_box.clear()
+        self.model_type_combo_box.addItems([translate('BiblesPlugin.ImportWizardForm', 'Embedding Models'),
+                                            translate('BiblesPlugin.ImportWizardForm', 'Transcription Models')])
+        self.model_type_combo_box.setCurrentIndex(current_index)
+        self.model_type_combo_box.blockSignals(False)
+        self.model_table_header_labels = [translate('BiblesPlugin.ImportWizardForm', 'Name'),
+                                          translate('BiblesPlugin.ImportWizardForm', 'Description'),
+                                          translate('BiblesPlugin.ImportWizardForm', 'Speed'),
+                                          translate('BiblesPlugin.ImportWizardForm', 'Performance'),
+                                          translate('BiblesPlugin.ImportWizardForm', 'Size (MB)')]
+        for table in (self.embedding_models_table, self.transcription_models_table):
+            if table:
+                table.model().set_header_labels(self.model_table_header_labels)
         self.download_location_page.setTitle(translate('BiblesPlugin.ImportWizardForm', 'Download Location'))
         self.download_location_page.setSubTitle(translate('BiblesPlugin.ImportWizardForm',
                                                           'Select the location to download the model to.'))
@@ -272,24 +393,19 @@ class ModelDownloadForm(OpenLPWizard):
         """
         Validate the current page before moving on to the next page.
         """
-        if self.currentPage() == self.welcome_page:
+        current_page = self.currentPage()
+        if current_page == self.welcome_page:
             return True
-        elif self.currentPage() == self.select_page:
-            if self.field('model_type') == ModelType.ENCODER.value:
-                if self.embedding_models_table.selectedItems():
-                    return True
-                else:
-                    critical_error_message_box(UiStrings().NISs, translate('BiblesPlugin.ImportWizardForm',
-                                                                           'Please select a model to import.'))
-                    return False
-            elif self.field('model_type') == ModelType.TRANSCRIBER.value:
-                if self.transcription_models_table.selectedItems():
-                    return True
-                else:
-                    critical_error_message_box(UiStrings().NISs, translate('BiblesPlugin.ImportWizardForm',
-                                                                           'Please select a model to import.'))
-                    return False
-        elif self.currentPage() == self.download_location_page:
+        elif current_page == self.select_page:
+            table = self.embedding_models_table if self.field('model_type') == ModelType.ENCODER.value \
+                else self.transcription_models_table
+            if table is not None and table.selectionModel().hasSelection():
+                return True
+            else:
+                critical_error_message_box(UiStrings().NISs, translate('BiblesPlugin.ImportWizardForm',
+                                                                       'Please select a model to import.'))
+                return False
+        elif current_page == self.download_location_page:
             if self.download_location_edit.path:
                 return True
             else:
@@ -297,21 +413,9 @@ class ModelDownloadForm(OpenLPWizard):
                                            translate('BiblesPlugin.ImportWizardForm',
                                                      'You need to specify a download location.'))
                 return False
-        if self.currentPage() == self.progress_page:
+        if current_page == self.progress_page:
             return True
 
-    def on_web_source_combo_box_index_changed(self, index):
-        """
-        Setup the list of Bibles when you select a different source on the web download page.
-
-        :param index: The index of the combo box.
-        """
-        self.web_translation_combo_box.clear()
-        if self.web_bible_list and index in self.web_bible_list:
-            bibles = list(self.web_bible_list[index].keys())
-            bibles.sort(key=get_locale_key)
-            self.web_translation_combo_box.addItems(bibles)
-
     def register_fields(self):
         """
         Register the bible import wizard fields.
@@ -326,7 +430,9 @@ class ModelDownloadForm(OpenLPWizard):
         self.finish_button.setVisible(False)
         self.cancel_button.setVisible(True)
         # The PathEdit fields are not initialised since that does not work well with the UI Internals
-        self.setField('model_type', 0)
+        with QtCore.QSignalBlocker(self.model_type_combo_box):
+            self.setField('model_type', 0)
+        self._show_models_page(0)
 
     def pre_wizard(self):
         """
@@ -334,32 +440,45 @@ class ModelDownloadForm(OpenLPWizard):
         """
         super(ModelDownloadForm, self).pre_wizard()
         self.progress_label.setText(WizardStrings.StartingImport)
-        self.application.process_events()
 
     def perform_wizard(self):
         """
         Perform the actual import.
         """
         model_type = self.field('model_type')
-        model_name = None
-        model_data = None
         if model_type == ModelType.ENCODER.value:
-            model_name = self.embedding_models_table.selectedItems()[0].text()
-            model_data = ModelInfo.embedding_models[model_name]
-        elif model_type == ModelType.TRANSCRIBER.value:
-            model_name = self.transcription_models_table.selectedItems()[0].text()
-            model_data = ModelInfo.transcription_models[model_name]
+            table, models = self.embedding_models_table, ModelInfo.embedding_models
+        else:
+            table, models = self.transcription_models_table, ModelInfo.transcription_models
+        model_name = self._get_selected_model_name(table)
+        model_data = asdict(models[model_name])
         self.settings.setValue('models/last directory download', self.download_location_edit.path)
         download_location = self.download_location_edit.path / clean_filename(model_name)
         create_paths(download_location)
         model_data['path'] = download_location
         model_class = model_data['library'].model_class
         model = model_class(model_name, self.manager, **model_data)
+        model.register(self)
+        # Download the model in a thread, and keep the wizard responsive until the download has finished
+        self.is_model_downloaded = False
+        self.progress_bar.setMaximum(100)
+        model.download_progress.connect(self.progress_bar.setValue)
+        worker = ModelDownloadWorker(model)
+        event_loop = QtCore.QEventLoop()
+        worker.download_finished.connect(self.on_model_download_finished)
+        worker.download_finished.connect(event_loop.quit)
+        run_thread(worker, 'model_download')
+        event_loop.exec()
         try:
-            if not model.stop_import_flag:
-                self.manager.import_model(model)
+            if self.is_model_downloaded:
+                self.manager.save_model(model)
                 if model_type == ModelType.ENCODER.value:
-                    self.manager.reload_bibles()
+                    # Only reload the bibles if a different encoder model has been downloaded
+                    fingerprint = hashlib.sha256('{name}|{path}|{url}'.format(
+                        name=model_name, path=download_location, url=model_data['url']).encode()).hexdigest()
+                    if fingerprint != self.settings.value('models/last encoder fingerprint'):
+                        self.manager.reload_bibles()
+                        self.settings.setValue('models/last encoder fingerprint', fingerprint)
                 self.progress_label.setText(WizardStrings.FinishedImport)
                 return
         except Exception:
@@ -368,6 +487,14 @@ class ModelDownloadForm(OpenLPWizard):
 
         self.progress_label.setText(translate('BiblesPlugin.ImportWizardForm', 'Your model import failed.'))
 
+    def on_model_download_finished(self, is_success):
+        """
+        Called when the model download thread has finished.
+
+        :param is_success: Whether the model was downloaded successfully.
+        """
+        self.is_model_downloaded = is_success
+
     def provide_help(self):
         """
         Provide help within the wizard by opening the appropriate page of the openlp manual in the user's browser
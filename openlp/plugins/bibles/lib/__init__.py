@@ -22,24 +22,50 @@
 The :mod:`lib` module contains all the library functionality for the bibles
 plugin.
 """
+from bisect import bisect_right
+from collections import ChainMap
+from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from importlib import import_module
+import json
 import logging
 import re
+import threading
+from types import MappingProxyType
 
-from openlp.core.common import Singleton
+from openlp.core.common.httputils import get_web_page
 from openlp.core.common.i18n import translate
 from openlp.core.common.registry import Registry
 
-from .models.sptranscriber import SpeechBrainTranscriberModel
-from .models.stencoder import SentenceTransformerEncoderModel
-from .models.tfencoder import TensorFlowEncoderModel
-from .models.whispertranscriber import WhisperTranscriberModel
-
 log = logging.getLogger(__name__)
 
 
 REFERENCE_MATCHES = {}
 REFERENCE_SEPARATORS = {}
+# Escapes the regular expression characters which are allowed in the separators
+RESERVED_CHARACTERS_TABLE = str.maketrans({character: '\\' + character for character in '\\.^$*+?{}[]()'})
+# Replaces the Unicode dashes and commas which may be typed in references with their ASCII equivalents
+REFERENCE_PUNCTUATION_TABLE = str.maketrans({**dict.fromkeys('\u00AD\u2010\u2011\u2012\u2014\u2212\uFE63\uFF0D', '-'),
+                                             '\u201A': ','})
+# The separator, display and default keys for the verse, range, list and end separators
+SEPARATOR_KEYS = (
+    ('sep_v', 'sep_v_display', 'sep_v_default'),
+    ('sep_r', 'sep_r_display', 'sep_r_default'),
+    ('sep_l', 'sep_l_display', 'sep_l_default'),
+    ('sep_e', None, 'sep_e_default')
+)
+# Returned by parse_reference when a reference is not valid, and must not be changed
+NO_REFERENCES = []
+PARSED_REFERENCES = {}
+MAX_PARSED_REFERENCES = 4096
+# Matches a size such as "420 MB" or "1.5GB", and the number of MB in each unit of size
+SIZE_PATTERN = re.compile(r'\s*(?P<size>\d+(?:\.\d+)?)\s*(?P<unit>[KMGT]B)?', re.IGNORECASE)
+SIZE_UNITS = {'KB': 1 / 1024, 'MB': 1, 'GB': 1024, 'TB': 1024 * 1024}
+# Model classes that have already been imported, keyed by library
+_MODEL_CLASSES = {}
+# Held while the lists of models are replaced with the ones from the model manifest
+MODEL_MANIFEST_LOCK = threading.Lock()
 
 
 class ModelType(Enum):
@@ -67,24 +93,135 @@ class ModelLibrary(Enum):
 
     @property
     def model_class(self):
-        if self == ModelLibrary.SENTENCE_TRANSFORMERS:
-            return SentenceTransformerEncoderModel
-        if self == ModelLibrary.TENSORFLOW:
-            return TensorFlowEncoderModel
-        if self == ModelLibrary.WHISPER:
-            return WhisperTranscriberModel
-        if self == ModelLibrary.SPEECHBRAIN:
-            return SpeechBrainTranscriberModel
-        return None
+        """
+        The class implementing models from this library. The module is only imported when it is first needed, since
+        the model libraries pull in very large dependencies such as PyTorch and TensorFlow.
+        """
+        if self in _MODEL_CLASSES:
+            return _MODEL_CLASSES[self]
+        class_path = MODEL_CLASS_PATHS.get(self)
+        if class_path is None:
+            return None
+        module_name, class_name = class_path
+        model_class = getattr(import_module(module_name), class_name)
+        _MODEL_CLASSES[self] = model_class
+        return model_class
 
     @property
     def model_type(self):
-        if self == ModelLibrary.SENTENCE_TRANSFORMERS or self == ModelLibrary.TENSORFLOW:
-            return ModelType.ENCODER
-        return ModelType.TRANSCRIBER
-
-
-class BibleStrings(metaclass=Singleton):
+        return MODEL_TYPES.get(self, ModelType.TRANSCRIBER)
+
+
+MODEL_CLASS_PATHS = {
+    ModelLibrary.SENTENCE_TRANSFORMERS: ('openlp.plugins.bibles.lib.models.stencoder',
+                                         'SentenceTransformerEncoderModel'),
+    ModelLibrary.TENSORFLOW: ('openlp.plugins.bibles.lib.models.tfencoder', 'TensorFlowEncoderModel'),
+    ModelLibrary.WHISPER: ('openlp.plugins.bibles.lib.models.whispertranscriber', 'WhisperTranscriberModel'),
+    ModelLibrary.SPEECHBRAIN: ('openlp.plugins.bibles.lib.models.sptranscriber', 'SpeechBrainTranscriberModel'),
+}
+MODEL_TYPES = {
+    ModelLibrary.SENTENCE_TRANSFORMERS: ModelType.ENCODER,
+    ModelLibrary.TENSORFLOW: ModelType.ENCODER,
+    ModelLibrary.WHISPER: ModelType.TRANSCRIBER,
+    ModelLibrary.SPEECHBRAIN: ModelType.TRANSCRIBER,
+}
+
+
+@lru_cache(maxsize=1)
+def get_book_names():
+    """
+    Build the translated book names once, keyed by the book abbreviation. The mapping is read-only because it is
+    shared by everything that uses it.
+    """
+    return MappingProxyType({
+        'Gen': translate('BiblesPlugin', 'Genesis'),
+        'Exod': translate('BiblesPlugin', 'Exodus'),
+        'Lev': translate('BiblesPlugin', 'Leviticus'),
+        'Num': translate('BiblesPlugin', 'Numbers'),
+        'Deut': translate('BiblesPlugin', 'Deuteronomy'),
+        'Josh': translate('BiblesPlugin', 'Joshua'),
+        'Judg': translate('BiblesPlugin', 'Judges'),
+        'Ruth': translate('BiblesPlugin', 'Ruth'),
+        '1Sam': translate('BiblesPlugin', '1 Samuel'),
+        '2Sam': translate('BiblesPlugin', '2 Samuel'),
+        '1Kgs': translate('BiblesPlugin', '1 Kings'),
+        '2Kgs': translate('BiblesPlugin', '2 Kings'),
+        '1Chr': translate('BiblesPlugin', '1 Chronicles'),
+        '2Chr': translate('BiblesPlugin', '2 Chronicles'),
+        'Esra': translate('BiblesPlugin', 'Ezra'),
+        'Neh': translate('BiblesPlugin', 'Nehemiah'),
+        'Esth': translate('BiblesPlugin', 'Esther'),
+        'Job': translate('BiblesPlugin', 'Job'),
+        'Ps': translate('BiblesPlugin', 'Psalms'),
+        'Prov': translate('BiblesPlugin', 'Proverbs'),
+        'Eccl': translate('BiblesPlugin', 'Ecclesiastes'),
+        'Song': translate('BiblesPlugin', 'Song of Solomon'),
+        'Isa': translate('BiblesPlugin', 'Isaiah'),
+        'Jer': translate('BiblesPlugin', 'Jeremiah'),
+        'Lam': translate('BiblesPlugin', 'Lamentations'),
+        'Ezek': translate('BiblesPlugin', 'Ezekiel'),
+        'Dan': translate('BiblesPlugin', 'Daniel'),
+        'Hos': translate('BiblesPlugin', 'Hosea'),
+        'Joel': translate('BiblesPlugin', 'Joel'),
+        'Amos': translate('BiblesPlugin', 'Amos'),
+        'Obad': translate('BiblesPlugin', 'Obadiah'),
+        'Jonah': translate('BiblesPlugin', 'Jonah'),
+        'Mic': translate('BiblesPlugin', 'Micah'),
+        'Nah': translate('BiblesPlugin', 'Nahum'),
+        'Hab': translate('BiblesPlugin', 'Habakkuk'),
+        'Zeph': translate('BiblesPlugin', 'Zephaniah'),
+        'Hag': translate('BiblesPlugin', 'Haggai'),
+        'Zech': translate('BiblesPlugin', 'Zechariah'),
+        'Mal': translate('BiblesPlugin', 'Malachi'),
+        'Matt': translate('BiblesPlugin', 'Matthew'),
+        'Mark': translate('BiblesPlugin', 'Mark'),
+        'Luke': translate('BiblesPlugin', 'Luke'),
+        'John': translate('BiblesPlugin', 'John'),
+        'Acts': translate('BiblesPlugin', 'Acts'),
+        'Rom': translate('BiblesPlugin', 'Romans'),
+        '1Cor': translate('BiblesPlugin', '1 Corinthians'),
+        '2Cor': translate('BiblesPlugin', '2 Corinthians'),
+        'Gal': translate('BiblesPlugin', 'Galatians'),
+        'Eph': translate('BiblesPlugin', 'Ephesians'),
+        'Phil': translate('BiblesPlugin', 'Philippians'),
+        'Col': translate('BiblesPlugin', 'Colossians'),
+        '1Thess': translate('BiblesPlugin', '1 Thessalonians'),
+        '2Thess': translate('BiblesPlugin', '2 Thessalonians'),
+        '1Tim': translate('BiblesPlugin', '1 Timothy'),
+        '2Tim': translate('BiblesPlugin', '2 Timothy'),
+        'Titus': translate('BiblesPlugin', 'Titus'),
+        'Phlm': translate('BiblesPlugin', 'Philemon'),
+        'Heb': translate('BiblesPlugin', 'Hebrews'),
+        'Jas': translate('BiblesPlugin', 'James'),
+        '1Pet': translate('BiblesPlugin', '1 Peter'),
+        '2Pet': translate('BiblesPlugin', '2 Peter'),
+        '1John': translate('BiblesPlugin', '1 John'),
+        '2John': translate('BiblesPlugin', '2 John'),
+        '3John': translate('BiblesPlugin', '3 John'),
+        'Jude': translate('BiblesPlugin', 'Jude'),
+        'Rev': translate('BiblesPlugin', 'Revelation'),
+        'Jdt': translate('BiblesPlugin', 'Judith'),
+        'Wis': translate('BiblesPlugin', 'Wisdom'),
+        'Tob': translate('BiblesPlugin', 'Tobit'),
+        'Sir': translate('BiblesPlugin', 'Sirach'),
+        'Bar': translate('BiblesPlugin', 'Baruch'),
+        '1Macc': translate('BiblesPlugin', '1 Maccabees'),
+        '2Macc': translate('BiblesPlugin', '2 Maccabees'),
+        '3Macc': translate('BiblesPlugin', '3 Maccabees'),
+        '4Macc': translate('BiblesPlugin', '4 Maccabees'),
+        'AddDan': translate('BiblesPlugin', 'Rest of Daniel'),
+        'AddEsth': translate('BiblesPlugin', 'Rest of Esther'),
+        'PrMan': translate('BiblesPlugin', 'Prayer of Manasses'),
+        'LetJer': translate('BiblesPlugin', 'Letter of Jeremiah'),
+        'PrAza': translate('BiblesPlugin', 'Prayer of Azariah'),
+        'Sus': translate('BiblesPlugin', 'Susanna'),
+        'Bel': translate('BiblesPlugin', 'Bel'),
+        '1Esdr': translate('BiblesPlugin', '1 Esdras'),
+        '2Esdr': translate('BiblesPlugin', '2 Esdras')
+    })
+
+
+class BibleStrings(object):
     """
     Provide standard strings for objects to use.
     """
@@ -92,99 +229,18 @@ class BibleStrings(metaclass=Singleton):
         """
         These strings should need a good reason to be retranslated elsewhere.
         """
-        self.BookNames = {
-            'Gen': translate('BiblesPlugin', 'Genesis'),
-            'Exod': translate('BiblesPlugin', 'Exodus'),
-            'Lev': translate('BiblesPlugin', 'Leviticus'),
-            'Num': translate('BiblesPlugin', 'Numbers'),
-            'Deut': translate('BiblesPlugin', 'Deuteronomy'),
-            'Josh': translate('BiblesPlugin', 'Joshua'),
-            'Judg': translate('BiblesPlugin', 'Judges'),
-            'Ruth': translate('BiblesPlugin', 'Ruth'),
-            '1Sam': translate('BiblesPlugin', '1 Samuel'),
-            '2Sam': translate('BiblesPlugin', '2 Samuel'),
-            '1Kgs': translate('BiblesPlugin', '1 Kings'),
-            '2Kgs': translate('BiblesPlugin', '2 Kings'),
-            '1Chr': translate('BiblesPlugin', '1 Chronicles'),
-            '2Chr': translate('BiblesPlugin', '2 Chronicles'),
-            'Esra': translate('BiblesPlugin', 'Ezra'),
-            'Neh': translate('BiblesPlugin', 'Nehemiah'),
-            'Esth': translate('BiblesPlugin', 'Esther'),
-            'Job': translate('BiblesPlugin', 'Job'),
-            'Ps': translate('BiblesPlugin', 'Psalms'),
-            'Prov': translate('BiblesPlugin', 'Proverbs'),
-            'Eccl': translate('BiblesPlugin', 'Ecclesiastes'),
-            'Song': translate('BiblesPlugin', 'Song of Solomon'),
-            'Isa': translate('BiblesPlugin', 'Isaiah'),
-            'Jer': translate('BiblesPlugin', 'Jeremiah'),
-            'Lam': translate('BiblesPlugin', 'Lamentations'),
-            'Ezek': translate('BiblesPlugin', 'Ezekiel'),
-            'Dan': translate('BiblesPlugin', 'Daniel'),
-            'Hos': translate('BiblesPlugin', 'Hosea'),
-            'Joel': translate('BiblesPlugin', 'Joel'),
-            'Amos': translate('BiblesPlugin', 'Amos'),
-            'Obad': translate('BiblesPlugin', 'Obadiah'),
-            'Jonah': translate('BiblesPlugin', 'Jonah'),
-            'Mic': translate('BiblesPlugin', 'Micah'),
-            'Nah': translate('BiblesPlugin', 'Nahum'),
-            'Hab': translate('BiblesPlugin', 'Habakkuk'),
-            'Zeph': translate('BiblesPlugin', 'Zephaniah'),
-            'Hag': translate('BiblesPlugin', 'Haggai'),
-            'Zech': translate('BiblesPlugin', 'Zechariah'),
-            'Mal': translate('BiblesPlugin', 'Malachi'),
-            'Matt': translate('BiblesPlugin', 'Matthew'),
-            'Mark': translate('BiblesPlugin', 'Mark'),
-            'Luke': translate('BiblesPlugin', 'Luke'),
-            'John': translate('BiblesPlugin', 'John'),
-            'Acts': translate('BiblesPlugin', 'Acts'),
-            'Rom': translate('BiblesPlugin', 'Romans'),
-            '1Cor': translate('BiblesPlugin', '1 Corinthians'),
-            '2Cor': translate('BiblesPlugin', '2 Corinthians'),
-            'Gal': translate('BiblesPlugin', 'Galatians'),
-            'Eph': translate('BiblesPlugin', 'Ephesians'),
-            'Phil': translate('BiblesPlugin', 'Philippians'),
-            'Col': translate('BiblesPlugin', 'Colossians'),
-            '1Thess': translate('BiblesPlugin', '1 Thessalonians'),
-            '2Thess': translate('BiblesPlugin', '2 Thessalonians'),
-            '1Tim': translate('BiblesPlugin', '1 Timothy'),
-            '2Tim': translate('BiblesPlugin', '2 Timothy'),
-            'Titus': translate('BiblesPlugin', 'Titus'),
-            'Phlm': translate('BiblesPlugin', 'Philemon'),
-            'Heb': translate('BiblesPlugin', 'Hebrews'),
-            'Jas': translate('BiblesPlugin', 'James'),
-            '1Pet': translate('BiblesPlugin', '1 Peter'),
-            '2Pet': translate('BiblesPlugin', '2 Peter'),
-            '1John': translate('BiblesPlugin', '1 John'),
-            '2John': translate('BiblesPlugin', '2 John'),
-            '3John': translate('BiblesPlugin', '3 John'),
-            'Jude': translate('BiblesPlugin', 'Jude'),
-            'Rev': translate('BiblesPlugin', 'Revelation'),
-            'Jdt': translate('BiblesPlugin', 'Judith'),
-            'Wis': translate('BiblesPlugin', 'Wisdom'),
-            'Tob': translate('BiblesPlugin', 'Tobit'),
-            'Sir': translate('BiblesPlugin', 'Sirach'),
-            'Bar': translate('BiblesPlugin', 'Baruch'),
-            '1Macc': translate('BiblesPlugin', '1 Maccabees'),
-            '2Macc': translate('BiblesPlugin', '2 Maccabees'),
-            '3Macc': translate('BiblesPlugin', '3 Maccabees'),
-            '4Macc': translate('BiblesPlugin', '4 Maccabees'),
-            'AddDan': translate('BiblesPlugin', 'Rest of Daniel'),
-            'AddEsth': translate('BiblesPlugin', 'Rest of Esther'),
-            'PrMan': translate('BiblesPlugin', 'Prayer of Manasses'),
-            'LetJer': translate('BiblesPlugin', 'Letter of Jeremiah'),
-            'PrAza': translate('BiblesPlugin', 'Prayer of Azariah'),
-            'Sus': translate('BiblesPlugin', 'Susanna'),
-            'Bel': translate('BiblesPlugin', 'Bel'),
-            '1Esdr': translate('BiblesPlugin', '1 Esdras'),
-            '2Esdr': translate('BiblesPlugin', '2 Esdras')
-        }
+        self.BookNames = get_book_names()
 
 
-def update_reference_separators():
+@lru_cache(maxsize=1)
+def get_default_separators():
     """
-    Updates separators and matches for parsing and formatting scripture references.
+    Build the translated default separators once. The language can only be changed by restarting OpenLP, so they do
+    not need to be rebuilt.
+
+    :return: The verse, range, list and end separators, each a ``|`` separated string of alternatives.
     """
-    default_separators = [
+    return (
         '|'.join([
             translate('BiblesPlugin', ':', 'Verse identifier e.g. Genesis 1 : 1 = Genesis Chapter 1 Verse 1'),
             translate('BiblesPlugin', 'v', 'Verse identifier e.g. Genesis 1 v 1 = Genesis Chapter 1 Verse 1'),
@@ -202,42 +258,65 @@ def update_reference_separators():
                                            'Genesis Chapter 1 Verses 1 To 2 And Verses 4 To 5'),
             translate('BiblesPlugin', 'and', 'connecting identifier e.g. Genesis 1 verse 1 - 2 and 4 - 5 = '
                                              'Genesis Chapter 1 Verses 1 To 2 And Verses 4 To 5')]),
-        '|'.join([translate('BiblesPlugin', 'end', 'ending identifier e.g. Genesis 1 verse 1 - end = '
-                                                   'Genesis Chapter 1 Verses 1 To The Last Verse')])]
+        translate('BiblesPlugin', 'end', 'ending identifier e.g. Genesis 1 verse 1 - end = '
+                                         'Genesis Chapter 1 Verses 1 To The Last Verse'))
+
+
+def update_reference_separators():
+    """
+    Updates separators and matches for parsing and formatting scripture references.
+    """
+    default_separators = get_default_separators()
+    clear_parsed_references()
     settings = Registry().get('settings')
     custom_separators = [
         settings.value('bibles/verse separator'),
         settings.value('bibles/range separator'),
         settings.value('bibles/list separator'),
         settings.value('bibles/end separator')]
-    for index, role in enumerate(['v', 'r', 'l', 'e']):
-        if custom_separators[index].strip('|') == '':
-            source_string = default_separators[index].strip('|')
+    for (separator_key, display_key, default_key), default_separator, custom_separator in \
+            zip(SEPARATOR_KEYS, default_separators, custom_separators):
+        if custom_separator.strip('|') == '':
+            source_string = default_separator.strip('|')
         else:
-            source_string = custom_separators[index].strip('|')
-        while '||' in source_string:
-            source_string = source_string.replace('||', '|')
-        if role != 'e':
-            REFERENCE_SEPARATORS['sep_{role}_display'.format(role=role)] = source_string.split('|')[0]
+            source_string = custom_separator.strip('|')
+        source_string = re.sub(r'\|+', '|', source_string)
+        if display_key:
+            REFERENCE_SEPARATORS[display_key] = source_string.split('|')[0]
+        # references are normalised before they are matched, so the separators need to be too
+        source_string = normalise_reference(source_string)
         # escape reserved characters
-        for character in '\\.^$*+?{}[]()':
-            source_string = source_string.replace(character, '\\' + character)
-        # add various Unicode alternatives
-        source_string = source_string.replace('-', '(?:[-\u00AD\u2010\u2011\u2012\u2014\u2014\u2212\uFE63\uFF0D])')
-        source_string = source_string.replace(',', '(?:[,\u201A])')
-        REFERENCE_SEPARATORS['sep_{role}'.format(role=role)] = r'\s*(?:{source})\s*'.format(source=source_string)
-        REFERENCE_SEPARATORS['sep_{role}_default'.format(role=role)] = default_separators[index]
+        source_string = source_string.translate(RESERVED_CHARACTERS_TABLE)
+        REFERENCE_SEPARATORS[separator_key] = r'\s*(?:{source})\s*'.format(source=source_string)
+        REFERENCE_SEPARATORS[default_key] = default_separator
     # verse range match: (<chapter>:)?<verse>(-((<chapter>:)?<verse>|end)?)?
     range_regex = '(?:(?P<from_chapter>[0-9]+){sep_v})?' \
         '(?P<from_verse>[0-9]+)(?P<range_to>{sep_r}(?:(?:(?P<to_chapter>' \
         '[0-9]+){sep_v})?(?P<to_verse>[0-9]+)|{sep_e})?)?'.format_map(REFERENCE_SEPARATORS)
-    REFERENCE_MATCHES['range'] = re.compile(r'^\s*{range}\s*$'.format(range=range_regex))
+    # The range, full and simple patterns are not anchored, they are used with fullmatch()
+    REFERENCE_MATCHES['range'] = re.compile(r'\s*{range}\s*'.format(range=range_regex))
     REFERENCE_MATCHES['range_separator'] = re.compile(REFERENCE_SEPARATORS['sep_l'])
     # full reference match: <book>(<range>(,(?!$)|(?=$)))+
     REFERENCE_MATCHES['full'] = \
-        re.compile(r'^\s*(?!\s)(?P<book>[\d]*[.]?[^\d\.]+)\.*(?<!\s)\s*'
-                   r'(?P<ranges>(?:{range_regex}(?:{sep_l}(?!\s*$)|(?=\s*$)))+)\s*$'.format(
+        re.compile(r'\s*(?!\s)(?P<book>[\d]*[.]?[^\d\.]+)\.*(?<!\s)\s*'
+                   r'(?P<ranges>(?:{range_regex}(?:{sep_l}(?!\s*$)|(?=\s*$)))+)\s*'.format(
                        range_regex=range_regex, sep_l=REFERENCE_SEPARATORS['sep_l']))
+    # simple reference match: <book> <chapter>(:<verse>(-<verse>)?)?
+    # This covers most typed references, and is parsed without splitting the reference into ranges.
+    REFERENCE_MATCHES['simple'] = \
+        re.compile(r'\s*(?!\s)(?P<book>[\d]*[.]?[^\d\.]+)\.*(?<!\s)\s*(?P<chapter>[1-9][0-9]*)'
+                   r'(?:{sep_v}(?P<from_verse>[1-9][0-9]*)(?:{sep_r}(?P<to_verse>[1-9][0-9]*))?)?\s*'.format_map(
+                       REFERENCE_SEPARATORS))
+
+
+def normalise_reference(reference):
+    """
+    Replace the Unicode alternatives of the dashes and commas in a reference with their ASCII equivalents, so that
+    the reference patterns only need to match the ASCII characters.
+
+    :param reference: The reference text.
+    """
+    return reference.translate(REFERENCE_PUNCTUATION_TABLE)
 
 
 def get_reference_separator(separator_type):
@@ -262,6 +341,13 @@ def get_reference_match(match_type):
     return REFERENCE_MATCHES[match_type]
 
 
+def clear_parsed_references():
+    """
+    Forget the references that have been parsed, e.g. when the separators or the books of a Bible change.
+    """
+    PARSED_REFERENCES.clear()
+
+
 def parse_reference(reference, bible, language_selection, book_ref_id=False):
     r"""
     This is the next generation über-awesome function that takes a person's typed in string and converts it to a list
@@ -327,50 +413,71 @@ def parse_reference(reference, bible, language_selection, book_ref_id=False):
     ``(?P<to_verse>[0-9]+)``
         The ``to_verse`` reference is equivalent to group 2.
 
-    The full reference is matched against get_reference_match('full'). This regular expression looks like this:
+    The full reference is matched against get_reference_match('full') with ``fullmatch()``. This regular expression
+    looks like this:
 
-    ``^\s*(?!\s)(?P<book>[\d]*[^\d]+)(?<!\s)\s*``
+    ``\s*(?!\s)(?P<book>[\d]*[^\d]+)(?<!\s)\s*``
         The ``book`` group starts with the first non-whitespace character. There are optional leading digits followed by
         non-digits. The group ends before the whitespace, or a full stop in front of the next digit.
 
-    ``(?P<ranges>(?:%(range_regex)s(?:%(sep_l)s(?!\s*$)|(?=\s*$)))+)\s*$``
+    ``(?P<ranges>(?:%(range_regex)s(?:%(sep_l)s(?!\s*$)|(?=\s*$)))+)\s*``
         The second group contains all ``ranges``. This can be multiple declarations of range_regex separated by a list
         separator.
 
     """
     log.debug('parse_reference("{text}")'.format(text=reference))
-    match = get_reference_match('full').match(reference)
+    reference = normalise_reference(reference)
+    cache_key = (reference, bible.name, language_selection, book_ref_id)
+    ref_list = PARSED_REFERENCES.get(cache_key)
+    if ref_list is None:
+        ref_list = _parse_reference(reference, bible, language_selection, book_ref_id)
+        # Only cache references that were found, a web bible may not have downloaded the book yet
+        if ref_list:
+            if len(PARSED_REFERENCES) >= MAX_PARSED_REFERENCES:
+                del PARSED_REFERENCES[next(iter(PARSED_REFERENCES))]
+            PARSED_REFERENCES[cache_key] = ref_list
+    if not ref_list:
+        return NO_REFERENCES
+    # Return a copy so that callers can not change the cached list
+    return list(ref_list)
+
+
+def _parse_reference(reference, bible, language_selection, book_ref_id):
+    """
+    Parse the reference without looking in the cache. See :func:`parse_reference` for details.
+    """
+    match = get_reference_match('simple').fullmatch(reference)
+    is_simple = match is not None
+    if not is_simple:
+        match = get_reference_match('full').fullmatch(reference)
     if match:
         log.debug('Matched reference {text}'.format(text=reference))
         book = match.group('book')
         if not book_ref_id:
             book_ref_ids = bible.get_book_ref_id_by_localised_name(book, language_selection)
         elif not bible.get_book_by_book_ref_id(book_ref_id):
-            return []
+            return NO_REFERENCES
         else:
             book_ref_ids = [book_ref_id]
         # We have not found the book so do not continue
         if not book_ref_ids:
-            return []
+            return NO_REFERENCES
+        if is_simple:
+            return _parse_simple_reference(match, book_ref_ids)
         ranges = match.group('ranges')
         range_list = get_reference_match('range_separator').split(ranges)
         ref_list = []
         chapter = None
+        # Look the range pattern up once, not for every range in the reference
+        match_range = get_reference_match('range').fullmatch
         for this_range in range_list:
-            range_match = get_reference_match('range').match(this_range)
-            from_chapter = range_match.group('from_chapter')
-            from_verse = range_match.group('from_verse')
-            has_range = range_match.group('range_to')
-            to_chapter = range_match.group('to_chapter')
-            to_verse = range_match.group('to_verse')
-            if from_chapter:
-                from_chapter = int(from_chapter)
-            if from_verse:
-                from_verse = int(from_verse)
-            if to_chapter:
-                to_chapter = int(to_chapter)
-            if to_verse:
-                to_verse = int(to_verse)
+            from_chapter, from_verse, has_range, to_chapter, to_verse = \
+                match_range(this_range).group('from_chapter', 'from_verse', 'range_to', 'to_chapter', 'to_verse')
+            # The numbers are either missing or only digits
+            from_chapter = int(from_chapter) if from_chapter else None
+            from_verse = int(from_verse) if from_verse else None
+            to_chapter = int(to_chapter) if to_chapter else None
+            to_verse = int(to_verse) if to_verse else None
             # Fill chapter fields with reasonable values.
             if from_chapter:
                 chapter = from_chapter
@@ -390,28 +497,50 @@ def parse_reference(reference, bible, language_selection, book_ref_id=False):
                 else:
                     to_chapter = to_verse
                     to_verse = None
-            # Append references to the list
-            for book_ref_id in book_ref_ids:
-                if has_range:
-                    if not from_verse:
-                        from_verse = 1
-                    if not to_verse:
-                        to_verse = -1
-                    if to_chapter and to_chapter > from_chapter:
-                        ref_list.append((book_ref_id, from_chapter, from_verse, -1))
-                        for i in range(from_chapter + 1, to_chapter):
-                            ref_list.append((book_ref_id, i, 1, -1))
-                        ref_list.append((book_ref_id, to_chapter, 1, to_verse))
-                    elif to_verse >= from_verse or to_verse == -1:
-                        ref_list.append((book_ref_id, from_chapter, from_verse, to_verse))
-                elif from_verse:
-                    ref_list.append((book_ref_id, from_chapter, from_verse, from_verse))
+            # Work out the chapters and verses of this range once, and then add them for each of the books
+            if has_range:
+                if not from_verse:
+                    from_verse = 1
+                if not to_verse:
+                    to_verse = -1
+                if to_chapter and to_chapter > from_chapter:
+                    range_refs = [(from_chapter, from_verse, -1)]
+                    range_refs.extend((i, 1, -1) for i in range(from_chapter + 1, to_chapter))
+                    range_refs.append((to_chapter, 1, to_verse))
+                elif to_verse >= from_verse or to_verse == -1:
+                    range_refs = [(from_chapter, from_verse, to_verse)]
                 else:
-                    ref_list.append((book_ref_id, from_chapter, 1, -1))
+                    continue
+            elif from_verse:
+                range_refs = [(from_chapter, from_verse, from_verse)]
+            else:
+                range_refs = [(from_chapter, 1, -1)]
+            ref_list.extend((ref_id, *range_ref) for ref_id in book_ref_ids for range_ref in range_refs)
         return ref_list
     else:
         log.debug('Invalid reference: {text}'.format(text=reference))
-        return []
+        return NO_REFERENCES
+
+
+def _parse_simple_reference(match, book_ref_ids):
+    """
+    Build the reference list for a reference which matched the ``simple`` pattern, i.e. a single chapter, verse or
+    range of verses in one chapter.
+
+    :param match: The match of the ``simple`` pattern.
+    :param book_ref_ids: The ids of the books the reference refers to.
+    """
+    chapter, from_verse, to_verse = match.group('chapter', 'from_verse', 'to_verse')
+    chapter = int(chapter)
+    if not from_verse:
+        from_verse, to_verse = 1, -1
+    elif not to_verse:
+        from_verse = to_verse = int(from_verse)
+    else:
+        from_verse, to_verse = int(from_verse), int(to_verse)
+        if to_verse < from_verse:
+            return NO_REFERENCES
+    return [(book_ref_id, chapter, from_verse, to_verse) for book_ref_id in book_ref_ids]
 
 
 class SearchResults(object):
@@ -437,509 +566,582 @@ class SearchResults(object):
         return len(self.verse_list) > 0
 
 
+# Descriptions shared by several of the models in ModelInfo
+WHISPER_DESCRIPTION = ('Whisper is a general-purpose speech recognition model. It is trained on a large dataset of '
+                       'diverse audio and is also a multitasking model that can perform multilingual speech '
+                       'recognition, speech translation, and language identification.')
+ALL_ROUND_DESCRIPTION = ('All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 '
+                         'billion training pairs.')
+SEMANTIC_SEARCH_DESCRIPTION = ('This model was tuned for semantic search: Given a query/question, it can find '
+                               'relevant passages. It was trained on a large and diverse set of (question, answer) '
+                               'pairs.')
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSpec(object):
+    """
+    The information about one of the available AI models.
+    """
+    display_name: str
+    description: str
+    library: ModelLibrary
+    type: ModelType
+    author: str
+    size: str
+    size_mb: int
+    performance: str
+    speed: str
+    url: str
+    base_model: str | None = None
+
+
 class ModelInfo(object):
     """
     Encapsulate the information about available AI models.
     """
-    embedding_models = {
-        'all-mpnet-base-v2': {
-            'display_name': 'all-mpnet-base-v2',
-            'description': 'All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 billion training pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'microsoft/mpnet-base',
-            'size': '420 MB',
-            'performance': 'Good',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/sentence-transformers/all-mpnet-base-v2',
-        },
-        'multi-qa-mpnet-base-cos-v1': {
-            'display_name': 'multi-qa-mpnet-base-cos-v1',
-            'description': 'This model was tuned for semantic search: Given a query/question, it can find relevant passages. It was trained on a large and diverse set of (question, answer) pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'microsoft/mpnet-base',
-            'size': '420 MB',
-            'performance': 'Good',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/sentence-transformers/multi-qa-mpnet-base-cos-v1',
-        },
-        'all-roberta-large-v1': {
-            'display_name': 'all-roberta-large-v1',
-            'description': 'All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 billion training pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'roberta-large',
-            'size': '1360 MB',
-            'performance': 'Good',
-            'speed': 'Slow',
-            'url': 'https://huggingface.co/sentence-transformers/all-roberta-large-v1',
-        },
-        'all-distilroberta-v1': {
-            'display_name': 'all-distilroberta-v1',
-            'description': 'All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 billion training pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'distilroberta-base',
-            'size': '290 MB',
-            'performance': 'Ok',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/sentence-transformers/all-distilroberta-v1',
-        },
-        'all-MiniLM-L12-v2': {
-            'display_name': 'all-MiniLM-L12-v1',
-            'description': 'All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 billion training pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'microsoft/MiniLM-L12-H384-uncased',
-            'size': '120 MB',
-            'performance': 'Ok',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/sentence-transformers/all-MiniLM-L12-v2',
-        },
-        'multi-qa-distilbert-cos-v1': {
-            'display_name': 'multi-qa-distilbert-cos-v1',
-            'description': 'This model was tuned for semantic search: Given a query/question, it can find relevant passages. It was trained on a large and diverse set of (question, answer) pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'distilbert-base-uncased',
-            'size': '250 MB',
-            'performance': 'Ok',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/sentence-transformers/multi-qa-distilbert-cos-v1',
-        },
-        'all-MiniLM-L6-v2': {
-            'display_name': 'all-MiniLM-L6-v1',
-            'description': 'All-round model tuned for many use-cases. Trained on a large and diverse dataset of over 1 billion training pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'nreimers/MiniLM-L6-H384-uncased',
-            'size': '80 MB',
-            'performance': 'Ok',
-            'speed': 'Very Fast',
-            'url': 'https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2',
-        },
-        'multi-qa-MiniLM-L6-cos-v1': {
-            'display_name': 'multi-qa-MiniLM-L6-cos-v1',
-            'description': 'This model was tuned for semantic search: Given a query/question, it can find relevant passages. It was trained on a large and diverse set of (question, answer) pairs.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'nreimers/MiniLM-L6-H384-uncased',
-            'size': '80 MB',
-            'performance': 'Ok',
-            'speed': 'Very Fast',
-            'url': 'https://huggingface.co/sentence-transformers/multi-qa-MiniLM-L6-cos-v1',
-        },
-        'paraphrase-multilingual-mpnet-base-v2': {
-            'display_name': 'paraphrase-multilingual-mpnet-base-v2',
-            'description': 'This model was trained for multilingual paraphrase mining. It can be used to find similar sentences in multiple languages.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'Teacher: paraphrase-mpnet-base-v2; Student: xlm-roberta-base',
-            'size': '970 MB',
-            'performance': 'Poor',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/sentence-transformers/paraphrase-multilingual-mpnet-base-v2',
-        },
-        'paraphrase-albert-small-v2': {
-            'display_name': 'paraphrase-albert-small-v2',
-            'description': 'This model was trained for paraphrase mining. It can be used to find similar sentences.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'nreimers/albert-small-v2',
-            'size': '43 MB',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/sentence-transformers/paraphrase-albert-small-v2',
-        },
-        'paraphrase-multilingual-MiniLM-L12-v2': {
-            'display_name': 'paraphrase-multilingual-MiniLM-L12-v2',
-            'description': 'This model was trained for multilingual paraphrase mining. It can be used to find similar sentences in multiple languages.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'Teacher: paraphrase-MiniLM-L12-v2; Student: microsoft/Multilingual-MiniLM-L12-H384',
-            'size': '420 MB',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2',
-        },
-        'paraphrase-MiniLM-L3-v2': {
-            'display_name': 'paraphrase-MiniLM-L3-v2',
-            'description': 'This model was trained for paraphrase mining. It can be used to find similar sentences.',
-            'library': ModelLibrary.SENTENCE_TRANSFORMERS,
-            'type': ModelType.ENCODER,
-            'author': 'Sentence-Transformers',
-            'base_model': 'nreimers/MiniLM-L3-H384-uncased',
-            'size': '61 MB',
-            'performance': 'Poor',
-            'speed': 'Very Fast',
-            'url': 'https://huggingface.co/sentence-transformers/paraphrase-MiniLM-L3-v2',
-        },
-        'universal-sentence-encoder': {
-            'display_name': 'universal-sentence-encoder',
-            'description': 'Encoder of greater-than-word length text trained on a variety of data.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '989 MB',
-            'base_model': 'universal-sentence-encoder',
-            'performance': 'Ok',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder/4',
-        },
-        'universal-sentence-encoder-large': {
-            'display_name': 'universal-sentence-encoder-large',
-            'description': 'Encoder of greater-than-word length text trained on a variety of data.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '605 MB',
-            'base_model': 'universal-sentence-encoder-large',
-            'performance': 'Ok',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder-large/5',
-        },
-        'universal-sentence-encoder-qa': {
-            'display_name': 'universal-sentence-encoder-qa',
-            'description': 'Greater-than-word length text encoder for question answer retrieval.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '617 MB',
-            'base_model': 'universal-sentence-encoder',
-            'performance': 'Ok',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder-qa/3',
-        },
-        'universal-sentence-encoder-multilingual': {
-            'display_name': 'universal-sentence-encoder-multilingual',
-            'description': '16 languages (Arabic, Chinese-simplified, Chinese-traditional, English, French, German, Italian, Japanese, Korean, Dutch, Polish, Portuguese, Spanish, Thai, Turkish, Russian) text encoder.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '279 MB',
-            'base_model': 'universal-sentence-encoder-multilingual',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder-multilingual/3',
-        },
-        'universal-sentence-encoder-multilingual-large': {
-            'display_name': 'universal-sentence-encoder-multilingual-large',
-            'description': '16 languages (Arabic, Chinese-simplified, Chinese-traditional, English, French, German, Italian, Japanese, Korean, Dutch, Polish, Portuguese, Spanish, Thai, Turkish, Russian) text encoder.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '350 MB',
-            'base_model': 'universal-sentence-encoder-multilingual-large',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder-multilingual-large/3',
-        },
-        'universal-sentence-encoder-multilingual-qa': {
-            'display_name': 'universal-sentence-encoder-multilingual-qa',
-            'description': 'Greater-than-word length text encoder for question answer retrieval.',
-            'library': ModelLibrary.TENSORFLOW,
-            'type': ModelType.ENCODER,
-            'author': 'Google',
-            'size': '617 MB',
-            'base_model': 'universal-sentence-encoder-multilingual',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://tfhub.dev/google/universal-sentence-encoder-multilingual-qa/3',
-        },
-    }
-    transcription_models = {
-        'openai-whisper-tiny': {
-            'display_name': 'openai-whisper-tiny',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '72 MB',
-            'performance': 'OK',
-            'speed': 'Very Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/d3dd57d32accea0b295c96e26691aa14d8822fac7d9d27d5dc00b4ca2826dd03/tiny.en.pt',
-        },
-        'openai-whisper-tiny-multilingual': {
-            'display_name': 'openai-whisper-tiny-multilingual',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '72 MB',
-            'performance': 'OK',
-            'speed': 'Very Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/65147644a518d12f04e32d6f3b26facc3f8dd46e5390956a9424a650c0ce22b9/tiny.pt',
-        },
-        'openai-whisper-base': {
-            'display_name': 'openai-whisper-base',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '139 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/25a8566e1d0c1e2231d1c762132cd20e0f96a85d16145c3a00adf5d1ac670ead/base.en.pt',
-        },
-        'openai-whisper-base-multilingual': {
-            'display_name': 'openai-whisper-base-multilingual',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '139 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/ed3a0b6b1c0edf879ad9b11b1af5a0e6ab5db9205f891f668f8b0e6c6326e34e/base.pt',
-        },
-        'openai-whisper-small': {
-            'display_name': 'openai-whisper-small',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '461 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/f953ad0fd29cacd07d5a9eda5624af0f6bcf2258be67c92b79389873d91e0872/small.en.pt',
-        },
-        'openai-whisper-small-multilingual': {
-            'display_name': 'openai-whisper-small-multilingual',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '461 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/9ecf779972d90ba49c06d968637d720dd632c55bbf19d441fb42bf17a411e794/small.pt',
-        },
-        'openai-whisper-medium': {
-            'display_name': 'openai-whisper-medium',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '1457 MB',
-            'performance': 'Very Good',
-            'speed': 'Medium',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/d7440d1dc186f76616474e0ff0b3b6b879abc9d1a4926b7adfa41db2d497ab4f/medium.en.pt',
-        },
-        'openai-whisper-medium-multilingual': {
-            'display_name': 'openai-whisper-medium-multilingual',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '1457 MB',
-            'performance': 'Very Good',
-            'speed': 'Medium',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/345ae4da62f9b3d59415adc60127b97c714f32e89e936602e85993674d08dcb1/medium.pt',
-        },
-        'openai-whisper-large-multilingual': {
-            'display_name': 'openai-whisper-large-multilingual',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '2944 MB',
-            'performance': 'Very Good',
-            'speed': 'Slow',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb/large-v3.pt',
-        },
-        'openai-whisper-large-multilingual-turbo': {
-            'display_name': 'openai-whisper-large-multilingual-turbo',
-            'description': 'Whisper is a general-purpose speech recognition model. It is trained on a large dataset of diverse audio and is also a multitasking model that can perform multilingual speech recognition, speech translation, and language identification.',
-            'library': ModelLibrary.WHISPER,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'OpenAI',
-            'size': '1543 MB',
-            'performance': 'Very Good',
-            'speed': 'Very Fast',
-            'url': 'https://openaipublic.azureedge.net/main/whisper/models/aff26ae408abcba5fbf8813c21e62b0941638c5f6eebfb145be0c9839262a19a/large-v3-turbo.pt',
-        },
-        # 'deepspeech-0.9.3': {
-        #     'display_name': 'deepspeech-0.9.3',
-        #     'description': 'DeepSpeech is an open-source Speech-To-Text engine, using a model trained by machine learning techniques based on Baidu\'s Deep Speech research paper.',
-        #     'library': ModelLibrary.DEEPSPEECH,
-        #     'type': ModelType.TRANSCRIBER,
-        #     'author': 'Mozilla',
-        #     'size': '1090 MB',
-        #     'performance': 'Good',
-        #     'speed': 'Fast',
-        #     'url': [
+    embedding_models = MappingProxyType({
+        'all-mpnet-base-v2': ModelSpec(
+            display_name='all-mpnet-base-v2',
+            description=ALL_ROUND_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='microsoft/mpnet-base',
+            size='420 MB',
+            size_mb=420,
+            performance='Good',
+            speed='Medium',
+            url='https://huggingface.co/sentence-transformers/all-mpnet-base-v2',
+        ),
+        'multi-qa-mpnet-base-cos-v1': ModelSpec(
+            display_name='multi-qa-mpnet-base-cos-v1',
+            description=SEMANTIC_SEARCH_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='microsoft/mpnet-base',
+            size='420 MB',
+            size_mb=420,
+            performance='Good',
+            speed='Medium',
+            url='https://huggingface.co/sentence-transformers/multi-qa-mpnet-base-cos-v1',
+        ),
+        'all-roberta-large-v1': ModelSpec(
+            display_name='all-roberta-large-v1',
+            description=ALL_ROUND_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='roberta-large',
+            size='1360 MB',
+            size_mb=1360,
+            performance='Good',
+            speed='Slow',
+            url='https://huggingface.co/sentence-transformers/all-roberta-large-v1',
+        ),
+        'all-distilroberta-v1': ModelSpec(
+            display_name='all-distilroberta-v1',
+            description=ALL_ROUND_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='distilroberta-base',
+            size='290 MB',
+            size_mb=290,
+            performance='Ok',
+            speed='Medium',
+            url='https://huggingface.co/sentence-transformers/all-distilroberta-v1',
+        ),
+        'all-MiniLM-L12-v2': ModelSpec(
+            display_name='all-MiniLM-L12-v1',
+            description=ALL_ROUND_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='microsoft/MiniLM-L12-H384-uncased',
+            size='120 MB',
+            size_mb=120,
+            performance='Ok',
+            speed='Fast',
+            url='https://huggingface.co/sentence-transformers/all-MiniLM-L12-v2',
+        ),
+        'multi-qa-distilbert-cos-v1': ModelSpec(
+            display_name='multi-qa-distilbert-cos-v1',
+            description=SEMANTIC_SEARCH_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='distilbert-base-uncased',
+            size='250 MB',
+            size_mb=250,
+            performance='Ok',
+            speed='Medium',
+            url='https://huggingface.co/sentence-transformers/multi-qa-distilbert-cos-v1',
+        ),
+        'all-MiniLM-L6-v2': ModelSpec(
+            display_name='all-MiniLM-L6-v1',
+            description=ALL_ROUND_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='nreimers/MiniLM-L6-H384-uncased',
+            size='80 MB',
+            size_mb=80,
+            performance='Ok',
+            speed='Very Fast',
+            url='https://huggingface.co/sentence-transformers/all-MiniLM-L6-v2',
+        ),
+        'multi-qa-MiniLM-L6-cos-v1': ModelSpec(
+            display_name='multi-qa-MiniLM-L6-cos-v1',
+            description=SEMANTIC_SEARCH_DESCRIPTION,
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='nreimers/MiniLM-L6-H384-uncased',
+            size='80 MB',
+            size_mb=80,
+            performance='Ok',
+            speed='Very Fast',
+            url='https://huggingface.co/sentence-transformers/multi-qa-MiniLM-L6-cos-v1',
+        ),
+        'paraphrase-multilingual-mpnet-base-v2': ModelSpec(
+            display_name='paraphrase-multilingual-mpnet-base-v2',
+            description='This model was trained for multilingual paraphrase mining. It can be used to find similar sentences in multiple languages.',
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='Teacher: paraphrase-mpnet-base-v2; Student: xlm-roberta-base',
+            size='970 MB',
+            size_mb=970,
+            performance='Poor',
+            speed='Medium',
+            url='https://huggingface.co/sentence-transformers/paraphrase-multilingual-mpnet-base-v2',
+        ),
+        'paraphrase-albert-small-v2': ModelSpec(
+            display_name='paraphrase-albert-small-v2',
+            description='This model was trained for paraphrase mining. It can be used to find similar sentences.',
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='nreimers/albert-small-v2',
+            size='43 MB',
+            size_mb=43,
+            performance='Poor',
+            speed='Fast',
+            url='https://huggingface.co/sentence-transformers/paraphrase-albert-small-v2',
+        ),
+        'paraphrase-multilingual-MiniLM-L12-v2': ModelSpec(
+            display_name='paraphrase-multilingual-MiniLM-L12-v2',
+            description='This model was trained for multilingual paraphrase mining. It can be used to find similar sentences in multiple languages.',
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='Teacher: paraphrase-MiniLM-L12-v2; Student: microsoft/Multilingual-MiniLM-L12-H384',
+            size='420 MB',
+            size_mb=420,
+            performance='Poor',
+            speed='Fast',
+            url='https://huggingface.co/sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2',
+        ),
+        'paraphrase-MiniLM-L3-v2': ModelSpec(
+            display_name='paraphrase-MiniLM-L3-v2',
+            description='This model was trained for paraphrase mining. It can be used to find similar sentences.',
+            library=ModelLibrary.SENTENCE_TRANSFORMERS,
+            type=ModelType.ENCODER,
+            author='Sentence-Transformers',
+            base_model='nreimers/MiniLM-L3-H384-uncased',
+            size='61 MB',
+            size_mb=61,
+            performance='Poor',
+            speed='Very Fast',
+            url='https://huggingface.co/sentence-transformers/paraphrase-MiniLM-L3-v2',
+        ),
+        'universal-sentence-encoder': ModelSpec(
+            display_name='universal-sentence-encoder',
+            description='Encoder of greater-than-word length text trained on a variety of data.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='989 MB',
+            size_mb=989,
+            base_model='universal-sentence-encoder',
+            performance='Ok',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder/4',
+        ),
+        'universal-sentence-encoder-large': ModelSpec(
+            display_name='universal-sentence-encoder-large',
+            description='Encoder of greater-than-word length text trained on a variety of data.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='605 MB',
+            size_mb=605,
+            base_model='universal-sentence-encoder-large',
+            performance='Ok',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder-large/5',
+        ),
+        'universal-sentence-encoder-qa': ModelSpec(
+            display_name='universal-sentence-encoder-qa',
+            description='Greater-than-word length text encoder for question answer retrieval.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='617 MB',
+            size_mb=617,
+            base_model='universal-sentence-encoder',
+            performance='Ok',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder-qa/3',
+        ),
+        'universal-sentence-encoder-multilingual': ModelSpec(
+            display_name='universal-sentence-encoder-multilingual',
+            description='16 languages (Arabic, Chinese-simplified, Chinese-traditional, English, French, German, Italian, Japanese, Korean, Dutch, Polish, Portuguese, Spanish, Thai, Turkish, Russian) text encoder.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='279 MB',
+            size_mb=279,
+            base_model='universal-sentence-encoder-multilingual',
+            performance='Poor',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder-multilingual/3',
+        ),
+        'universal-sentence-encoder-multilingual-large': ModelSpec(
+            display_name='universal-sentence-encoder-multilingual-large',
+            description='16 languages (Arabic, Chinese-simplified, Chinese-traditional, English, French, German, Italian, Japanese, Korean, Dutch, Polish, Portuguese, Spanish, Thai, Turkish, Russian) text encoder.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='350 MB',
+            size_mb=350,
+            base_model='universal-sentence-encoder-multilingual-large',
+            performance='Poor',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder-multilingual-large/3',
+        ),
+        'universal-sentence-encoder-multilingual-qa': ModelSpec(
+            display_name='universal-sentence-encoder-multilingual-qa',
+            description='Greater-than-word length text encoder for question answer retrieval.',
+            library=ModelLibrary.TENSORFLOW,
+            type=ModelType.ENCODER,
+            author='Google',
+            size='617 MB',
+            size_mb=617,
+            base_model='universal-sentence-encoder-multilingual',
+            performance='Poor',
+            speed='Fast',
+            url='https://tfhub.dev/google/universal-sentence-encoder-multilingual-qa/3',
+        ),
+    })
+    transcription_models = MappingProxyType({
+        'openai-whisper-tiny': ModelSpec(
+            display_name='openai-whisper-tiny',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='72 MB',
+            size_mb=72,
+            performance='OK',
+            speed='Very Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/d3dd57d32accea0b295c96e26691aa14d8822fac7d9d27d5dc00b4ca2826dd03/tiny.en.pt',
+        ),
+        'openai-whisper-tiny-multilingual': ModelSpec(
+            display_name='openai-whisper-tiny-multilingual',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='72 MB',
+            size_mb=72,
+            performance='OK',
+            speed='Very Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/65147644a518d12f04e32d6f3b26facc3f8dd46e5390956a9424a650c0ce22b9/tiny.pt',
+        ),
+        'openai-whisper-base': ModelSpec(
+            display_name='openai-whisper-base',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='139 MB',
+            size_mb=139,
+            performance='Good',
+            speed='Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/25a8566e1d0c1e2231d1c762132cd20e0f96a85d16145c3a00adf5d1ac670ead/base.en.pt',
+        ),
+        'openai-whisper-base-multilingual': ModelSpec(
+            display_name='openai-whisper-base-multilingual',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='139 MB',
+            size_mb=139,
+            performance='Good',
+            speed='Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/ed3a0b6b1c0edf879ad9b11b1af5a0e6ab5db9205f891f668f8b0e6c6326e34e/base.pt',
+        ),
+        'openai-whisper-small': ModelSpec(
+            display_name='openai-whisper-small',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='461 MB',
+            size_mb=461,
+            performance='Good',
+            speed='Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/f953ad0fd29cacd07d5a9eda5624af0f6bcf2258be67c92b79389873d91e0872/small.en.pt',
+        ),
+        'openai-whisper-small-multilingual': ModelSpec(
+            display_name='openai-whisper-small-multilingual',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='461 MB',
+            size_mb=461,
+            performance='Good',
+            speed='Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/9ecf779972d90ba49c06d968637d720dd632c55bbf19d441fb42bf17a411e794/small.pt',
+        ),
+        'openai-whisper-medium': ModelSpec(
+            display_name='openai-whisper-medium',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='1457 MB',
+            size_mb=1457,
+            performance='Very Good',
+            speed='Medium',
+            url='https://openaipublic.azureedge.net/main/whisper/models/d7440d1dc186f76616474e0ff0b3b6b879abc9d1a4926b7adfa41db2d497ab4f/medium.en.pt',
+        ),
+        'openai-whisper-medium-multilingual': ModelSpec(
+            display_name='openai-whisper-medium-multilingual',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='1457 MB',
+            size_mb=1457,
+            performance='Very Good',
+            speed='Medium',
+            url='https://openaipublic.azureedge.net/main/whisper/models/345ae4da62f9b3d59415adc60127b97c714f32e89e936602e85993674d08dcb1/medium.pt',
+        ),
+        'openai-whisper-large-multilingual': ModelSpec(
+            display_name='openai-whisper-large-multilingual',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='2944 MB',
+            size_mb=2944,
+            performance='Very Good',
+            speed='Slow',
+            url='https://openaipublic.azureedge.net/main/whisper/models/e5b1a55b89c1367dacf97e3e19bfd829a01529dbfdeefa8caeb59b3f1b81dadb/large-v3.pt',
+        ),
+        'openai-whisper-large-multilingual-turbo': ModelSpec(
+            display_name='openai-whisper-large-multilingual-turbo',
+            description=WHISPER_DESCRIPTION,
+            library=ModelLibrary.WHISPER,
+            type=ModelType.TRANSCRIBER,
+            author='OpenAI',
+            size='1543 MB',
+            size_mb=1543,
+            performance='Very Good',
+            speed='Very Fast',
+            url='https://openaipublic.azureedge.net/main/whisper/models/aff26ae408abcba5fbf8813c21e62b0941638c5f6eebfb145be0c9839262a19a/large-v3-turbo.pt',
+        ),
+        # 'deepspeech-0.9.3': ModelSpec(
+        #     display_name='deepspeech-0.9.3',
+        #     description='DeepSpeech is an open-source Speech-To-Text engine, using a model trained by machine learning techniques based on Baidu\'s Deep Speech research paper.',
+        #     library=ModelLibrary.DEEPSPEECH,
+        #     type=ModelType.TRANSCRIBER,
+        #     author='Mozilla',
+        #     size='1090 MB',
+        #     size_mb=1090,
+        #     performance='Good',
+        #     speed='Fast',
+        #     url=(
         #         'https://github.com/mozilla/DeepSpeech/releases/download/v0.9.3/deepspeech-0.9.3-models.pbmm',
         #         'https://github.com/mozilla/DeepSpeech/releases/download/v0.9.3/deepspeech-0.9.3-models.scorer',
-        #     ]
-        # },
-        'asr-crdnn-transformerlm-librispeech': {
-            'display_name': 'asr-crdnn-transformerlm-librispeech',
-            'description': 'A CRDNN with CTC/Attention and RNNLM to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '818 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-crdnn-transformerlm-librispeech',
-        },
-        'asr-streaming-conformer-librispeech': {
-            'display_name': 'asr-streaming-conformer-librispeech',
-            'description': 'A streaming conformer model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '335 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-streaming-conformer-librispeech',
-        },
-        'asr-wav2vec2-commonvoice-14-en': {
-            'display_name': 'asr-wav2vec2-commonvoice-14-en',
-            'description': 'A Wav2Vec 2.0 (no LM) model with CT to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '2263 MB',
-            'performance': 'OK',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/speechbrain/asr-wav2vec2-commonvoice-14-en',
-        },
-        'asr-conformer-transformerlm-librispeech': {
-            'display_name': 'asr-conformer-transformerlm-librispeech',
-            'description': 'A transformer (with transformer LM) model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '824 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-conformer-transformerlm-librispeech',
-        },
-        'asr-wav2vec2-commonvoice-en': {
-            'display_name': 'asr-wav2vec2-commonvoice-en',
-            'description': 'A Wav2Vec 2.0 (no LM) model with CTC to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '1340 MB',
-            'performance': 'OK',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/speechbrain/asr-wav2vec2-commonvoice-en',
-        },
-        'asr-wav2vec2-switchboard': {
-            'display_name': 'asr-wav2vec2-switchboard',
-            'description': 'A Wav2Vec 2.0 (no LM) model with CTC to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '1270 MB',
-            'performance': 'OK',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/speechbrain/asr-wav2vec2-switchboard',
-        },
-        'asr-crdnn-switchboard': {
-            'display_name': 'asr-crdnn-switchboard',
-            'description': 'A CRDNN with CTC/Attention (no LM) to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '487 MB',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-crdnn-switchboard',
-        },
-        'asr-transformer-switchboard': {
-            'display_name': 'asr-transformer-switchboard',
-            'description': 'A transformer model to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '159 MB',
-            'performance': 'Ok',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-transformer-switchboard',
-        },
-        'asr-wav2vec2-librispeech': {
-            'display_name': 'asr-wav2vec2-librispeech',
-            'description': 'A Wav2Vec 2.0 model with CTC to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '1270 MB',
-            'performance': 'Good',
-            'speed': 'Medium',
-            'url': 'https://huggingface.co/speechbrain/asr-wav2vec2-librispeech',
-        },
-        'asr-conformersmall-transformerlm-librispeech': {
-            'display_name': 'asr-conformersmall-transformerlm-librispeech',
-            'description': 'A small conformer (13M parameters) (with transformer LM) model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '446 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-conformersmall-transformerlm-librispeech',
-        },
-        'asr-transformer-transformerlm-librispeech': {
-            'display_name': 'asr-transformer-transformerlm-librispeech',
-            'description': 'A transformer model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '673 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-transformer-transformerlm-librispeech',
-        },
-        'asr-branchformer-large-tedlium2': {
-            'display_name': 'asr-branchformer-large-tedlium2',
-            'description': 'A branchformer model to perform automatic speech recognition from an end-to-end system pretrained on Tedlium2 (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '418 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-branchformer-large-tedlium2',
-        },
-        'asr-crdnn-rnnlm-librispeech': {
-            'display_name': 'asr-crdnn-rnnlm-librispeech',
-            'description': 'A CRDNN with CTC/Attention and RNNLM to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '693 MB',
-            'performance': 'Good',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-crdnn-rnnlm-librispeech',
-        },
-        'asr-crdnn-commonvoice-14-en': {
-            'display_name': 'asr-crdnn-commonvoice-14-en',
-            'description': 'A CRDNN with CTC/Attention to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
-            'library': ModelLibrary.SPEECHBRAIN,
-            'type': ModelType.TRANSCRIBER,
-            'author': 'speechbrain',
-            'size': '594 MB',
-            'performance': 'Poor',
-            'speed': 'Fast',
-            'url': 'https://huggingface.co/speechbrain/asr-crdnn-commonvoice-14-en',
-        }
-    }
-    all_models = {**embedding_models, **transcription_models}
+        #     )
+        # ),
+        'asr-crdnn-transformerlm-librispeech': ModelSpec(
+            display_name='asr-crdnn-transformerlm-librispeech',
+            description='A CRDNN with CTC/Attention and RNNLM to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='818 MB',
+            size_mb=818,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-crdnn-transformerlm-librispeech',
+        ),
+        'asr-streaming-conformer-librispeech': ModelSpec(
+            display_name='asr-streaming-conformer-librispeech',
+            description='A streaming conformer model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='335 MB',
+            size_mb=335,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-streaming-conformer-librispeech',
+        ),
+        'asr-wav2vec2-commonvoice-14-en': ModelSpec(
+            display_name='asr-wav2vec2-commonvoice-14-en',
+            description='A Wav2Vec 2.0 (no LM) model with CT to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='2263 MB',
+            size_mb=2263,
+            performance='OK',
+            speed='Medium',
+            url='https://huggingface.co/speechbrain/asr-wav2vec2-commonvoice-14-en',
+        ),
+        'asr-conformer-transformerlm-librispeech': ModelSpec(
+            display_name='asr-conformer-transformerlm-librispeech',
+            description='A transformer (with transformer LM) model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='824 MB',
+            size_mb=824,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-conformer-transformerlm-librispeech',
+        ),
+        'asr-wav2vec2-commonvoice-en': ModelSpec(
+            display_name='asr-wav2vec2-commonvoice-en',
+            description='A Wav2Vec 2.0 (no LM) model with CTC to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='1340 MB',
+            size_mb=1340,
+            performance='OK',
+            speed='Medium',
+            url='https://huggingface.co/speechbrain/asr-wav2vec2-commonvoice-en',
+        ),
+        'asr-wav2vec2-switchboard': ModelSpec(
+            display_name='asr-wav2vec2-switchboard',
+            description='A Wav2Vec 2.0 (no LM) model with CTC to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='1270 MB',
+            size_mb=1270,
+            performance='OK',
+            speed='Medium',
+            url='https://huggingface.co/speechbrain/asr-wav2vec2-switchboard',
+        ),
+        'asr-crdnn-switchboard': ModelSpec(
+            display_name='asr-crdnn-switchboard',
+            description='A CRDNN with CTC/Attention (no LM) to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='487 MB',
+            size_mb=487,
+            performance='Poor',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-crdnn-switchboard',
+        ),
+        'asr-transformer-switchboard': ModelSpec(
+            display_name='asr-transformer-switchboard',
+            description='A transformer model to perform automatic speech recognition from an end-to-end system pretrained on Switchboard (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='159 MB',
+            size_mb=159,
+            performance='Ok',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-transformer-switchboard',
+        ),
+        'asr-wav2vec2-librispeech': ModelSpec(
+            display_name='asr-wav2vec2-librispeech',
+            description='A Wav2Vec 2.0 model with CTC to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='1270 MB',
+            size_mb=1270,
+            performance='Good',
+            speed='Medium',
+            url='https://huggingface.co/speechbrain/asr-wav2vec2-librispeech',
+        ),
+        'asr-conformersmall-transformerlm-librispeech': ModelSpec(
+            display_name='asr-conformersmall-transformerlm-librispeech',
+            description='A small conformer (13M parameters) (with transformer LM) model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='446 MB',
+            size_mb=446,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-conformersmall-transformerlm-librispeech',
+        ),
+        'asr-transformer-transformerlm-librispeech': ModelSpec(
+            display_name='asr-transformer-transformerlm-librispeech',
+            description='A transformer model with transformer language model to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='673 MB',
+            size_mb=673,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-transformer-transformerlm-librispeech',
+        ),
+        'asr-branchformer-large-tedlium2': ModelSpec(
+            display_name='asr-branchformer-large-tedlium2',
+            description='A branchformer model to perform automatic speech recognition from an end-to-end system pretrained on Tedlium2 (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='418 MB',
+            size_mb=418,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-branchformer-large-tedlium2',
+        ),
+        'asr-crdnn-rnnlm-librispeech': ModelSpec(
+            display_name='asr-crdnn-rnnlm-librispeech',
+            description='A CRDNN with CTC/Attention and RNNLM to perform automatic speech recognition from an end-to-end system pretrained on LibriSpeech (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='693 MB',
+            size_mb=693,
+            performance='Good',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-crdnn-rnnlm-librispeech',
+        ),
+        'asr-crdnn-commonvoice-14-en': ModelSpec(
+            display_name='asr-crdnn-commonvoice-14-en',
+            description='A CRDNN with CTC/Attention to perform automatic speech recognition from an end-to-end system pretrained on CommonVoice (EN) within SpeechBrain.',
+            library=ModelLibrary.SPEECHBRAIN,
+            type=ModelType.TRANSCRIBER,
+            author='speechbrain',
+            size='594 MB',
+            size_mb=594,
+            performance='Poor',
+            speed='Fast',
+            url='https://huggingface.co/speechbrain/asr-crdnn-commonvoice-14-en',
+        )
+    })
+    # A view over both read-only mappings, so that they are not copied into a third one
+    all_models = ChainMap(embedding_models, transcription_models)
 
     @staticmethod
     def get_model_info(model_name):
@@ -949,22 +1151,130 @@ class ModelInfo(object):
         :param model_name: The name of the model.
         :return: The model information.
         """
-        if model_name in ModelInfo.embedding_models:
-            return ModelInfo.embedding_models[model_name]
-        elif model_name in ModelInfo.transcription_models:
-            return ModelInfo.transcription_models[model_name]
-        return None
+        # The lock makes sure that a result from the old models is never cached after they have been replaced
+        with MODEL_MANIFEST_LOCK:
+            return ModelInfo._get_model_info(model_name)
+
+    @staticmethod
+    def get_models_by_type(model_type):
+        """
+        Get the names of the models of the given type. The list is built the first time each type is asked for.
+
+        :param model_type: The :class:`ModelType` of the models.
+        :return: A tuple of model names.
+        """
+        with MODEL_MANIFEST_LOCK:
+            return ModelInfo._get_models_by_type(model_type)
+
+    @staticmethod
+    def get_models_by_library(library):
+        """
+        Get the names of the models from the given library. The list is built the first time each library is asked
+        for.
+
+        :param library: The :class:`ModelLibrary` of the models.
+        :return: A tuple of model names.
+        """
+        with MODEL_MANIFEST_LOCK:
+            return ModelInfo._get_models_by_library(library)
+
+    @staticmethod
+    def get_models_fitting(max_mb):
+        """
+        Get the names of the models which are no bigger than the given size, smallest first.
+
+        :param max_mb: The largest size of model to return, in MB.
+        :return: A tuple of model names.
+        """
+        with MODEL_MANIFEST_LOCK:
+            sizes, names = ModelInfo._get_model_sizes()
+        return names[:bisect_right(sizes, max_mb)]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_model_info(model_name):
+        return ModelInfo.all_models.get(model_name)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_models_by_type(model_type):
+        return tuple(name for name, model_spec in ModelInfo.all_models.items() if model_spec.type == model_type)
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_models_by_library(library):
+        return tuple(name for name, model_spec in ModelInfo.all_models.items() if model_spec.library == library)
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_model_sizes():
+        """
+        Get the sizes of all the models in ascending order, with the names of the models in the same order.
+
+        :return: A tuple of the sizes in MB and a tuple of the model names.
+        """
+        models = sorted(ModelInfo.all_models.items(), key=lambda item: item[1].size_mb)
+        return tuple(model_spec.size_mb for _, model_spec in models), tuple(name for name, _ in models)
+
+    @staticmethod
+    def _clear_caches():
+        """
+        Forget the cached results of the lookups, after the lists of models have been replaced.
+        """
+        ModelInfo._get_model_info.cache_clear()
+        ModelInfo._get_models_by_type.cache_clear()
+        ModelInfo._get_models_by_library.cache_clear()
+        ModelInfo._get_model_sizes.cache_clear()
+
+    @staticmethod
+    def refresh():
+        """
+        Refresh the lists of models from the manifest at the ``bibles/model manifest url`` setting. The manifest is
+        downloaded in the background and the models built into OpenLP are used until it arrives, or if it can't be
+        downloaded, so this never blocks and OpenLP still starts without a network connection.
+        """
+        url = Registry().get('settings').value('bibles/model manifest url')
+        if url:
+            threading.Thread(target=ModelInfo._refresh_from_manifest, args=(url,), daemon=True).start()
 
+    @staticmethod
+    def _refresh_from_manifest(url):
+        """
+        Download the model manifest and replace the lists of models with the ones in it. The manifest is a JSON object
+        with ``embedding_models`` and ``transcription_models`` objects, which map the model names to the fields of
+        :class:`ModelSpec`, with the library and type given by name, e.g. ``"whisper"``.
 
+        :param url: The URL of the manifest.
+        """
+        try:
+            manifest = json.loads(get_web_page(url))
+            embedding_models, transcription_models = [
+                {name: ModelSpec(**{**fields, 'library': ModelLibrary[fields['library'].upper()],
+                                    'type': ModelType[fields['type'].upper()]})
+                 for name, fields in manifest[key].items()}
+                for key in ('embedding_models', 'transcription_models')]
+        except Exception:
+            log.exception('Unable to refresh the models from %s, using the built in models', url)
+            return
+        log.debug('Refreshed the models from %s', url)
+        with MODEL_MANIFEST_LOCK:
+            ModelInfo.embedding_models = MappingProxyType(embedding_models)
+            ModelInfo.transcription_models = MappingProxyType(transcription_models)
+            ModelInfo.all_models = ChainMap(ModelInfo.embedding_models, ModelInfo.transcription_models)
+            ModelInfo._clear_caches()
+
+
+@lru_cache(maxsize=None)
 def get_size_from_string(size_string: str, unit: str = 'MB') -> int:
     """
-    Get the size from the size string.
+    Get the size in MB from the size string, e.g. ``'420 MB'``, ``'1.5 GB'`` or ``'1457MB'``.
 
     :param size_string: The size string.
-    :param unit: The unit of the size.
-    :return: The size.
+    :param unit: The unit of the size, if the size string does not include one.
+    :return: The size in MB, or 0 if the size string does not start with a number.
     """
-    size = int(size_string.split(' ')[0])
-    if unit == 'GB':
-        size *= 1024
-    return size
+    match = SIZE_PATTERN.match(size_string)
+    if not match:
+        return 0
+    size, size_unit = match.group('size', 'unit')
+    return int(float(size) * SIZE_UNITS.get((size_unit or unit).upper(), 1))
@@ -27,7 +27,7 @@ from typing import Any, List, Optional, Tuple
 
 import chardet
 from PySide6 import QtCore
-from sqlalchemy import Column, DateTime, Enum, ForeignKey, JSON, LargeBinary, func, or_
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, JSON, LargeBinary, event, func, or_
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session, declarative_base, relationship
 from sqlalchemy.types import Unicode, UnicodeText, Integer
@@ -45,6 +45,21 @@ from openlp.plugins.bibles.lib import BibleStrings, ModelLibrary, ModelType, upg
 log = logging.getLogger(__name__)
 
 RESERVED_CHARACTERS = '\\.^$*+?{}[]()'
+# Bibles are read far more often than they are written, so give SQLite a larger page cache and memory map
+SQLITE_PRAGMAS = ('PRAGMA cache_size = -65536', 'PRAGMA temp_store = MEMORY', 'PRAGMA mmap_size = 268435456')
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    """
+    Apply the ``SQLITE_PRAGMAS`` to a new connection to a Bible database.
+
+    :param dbapi_connection: The new SQLite connection.
+    :param connection_record: The pool's record of the connection.
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
 
 
 class BibleDB(DBManager):
@@ -166,7 +181,7 @@ class BibleDB(DBManager):
             id = Column(Integer, primary_key=True)
             verse_id = Column(Integer, ForeignKey('verse.id'), index=True)
             model_name = Column(Unicode(50), index=True)
-            encoding = Column(LargeBinary, index=True)
+            encoding = Column(LargeBinary)
 
             verse = relationship('Verse', back_populates='encodings')
 
@@ -177,6 +192,8 @@ class BibleDB(DBManager):
         self.Encoding = Encoding
 
         session, metadata = init_db(url, base=Base)
+        if metadata.bind.dialect.name == 'sqlite':
+            event.listen(metadata.bind, 'connect', set_sqlite_pragmas)
         metadata.create_all(bind=metadata.bind, checkfirst=True)
         return session
 
@@ -276,6 +293,17 @@ class BibleDB(DBManager):
         else:
             self.save_object(self.BibleMeta(key=key, value=value))
 
+    def get_meta_values(self, keys: List[str]) -> dict:
+        """
+        Return the values of several BibleMeta objects with a single query.
+
+        :param keys: The keys of the BibleMeta objects.
+        :return: A dictionary of the keys that were found and their values.
+        """
+        log.debug('BibleDB.get_meta_values({keys})'.format(keys=keys))
+        metas = self.get_all_objects(self.BibleMeta, filter_clause=self.BibleMeta.key.in_(keys))
+        return {meta.key: meta.value for meta in metas}
+
     def get_book(self, book: str):
         """
         Return a book object from the database.
@@ -325,7 +353,7 @@ class BibleDB(DBManager):
         else:
             book_list = []
             if language_selection == LanguageSelection.Application:
-                books = [key for key in list(book_names.keys()) if regex_book.match(book_names[key])]
+                books = [key for key, name in book_names.items() if regex_book.match(name)]
                 book_list = [_f for _f in map(BiblesResourcesDB.get_book, books) if _f]
             elif language_selection == LanguageSelection.English:
                 books = BiblesResourcesDB.get_books_like(book)
@@ -416,6 +444,18 @@ class BibleDB(DBManager):
             return 0
         return count
 
+    def get_chapter_counts(self) -> dict:
+        """
+        Return the number of chapters in each book, with a single query.
+
+        :return: A dictionary of book reference ids and their chapter counts.
+        """
+        log.debug('BibleDB.get_chapter_counts()')
+        counts = self.session.query(self.Book.book_reference_id, func.max(self.Verse.chapter)).join(self.Book) \
+            .group_by(self.Book.book_reference_id) \
+            .all()
+        return {book_ref_id: count or 0 for book_ref_id, count in counts}
+
     def get_verse_count(self, book_ref_id: str, chapter: int) -> int:
         """
         Return the number of verses in a chapter.
@@ -757,6 +757,15 @@ class HTTPBible(BibleImport, RegistryProperties):
         log.debug('HTTPBible.get_chapter_count("{name}")'.format(name=book.name))
         return BiblesResourcesDB.get_chapter_count(book.book_reference_id)
 
+    def get_chapter_counts(self):
+        """
+        Return the number of chapters in each book. Only some chapters of a web Bible are stored locally, so the
+        counts come from the Bible resources database.
+        """
+        log.debug('HTTPBible.get_chapter_counts()')
+        return {book.book_reference_id: BiblesResourcesDB.get_chapter_count(book.book_reference_id)
+                for book in self.get_books()}
+
     def get_verse_count(self, book_id, chapter):
         """
         Return the number of verses for the specified chapter and book.
@@ -19,8 +19,8 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>. #
 ##########################################################################
 import datetime
-import gc
 import logging
+import threading
 from pathlib import Path
 
 from sqlalchemy import and_
@@ -32,7 +32,7 @@ from openlp.core.common.i18n import UiStrings, translate
 from openlp.core.common.mixins import LogMixin, RegistryProperties
 from openlp.core.common.registry import Registry
 from openlp.core.db.manager import DBManager
-from openlp.plugins.bibles.lib import ModelInfo, ModelType, parse_reference
+from openlp.plugins.bibles.lib import ModelInfo, ModelType, clear_parsed_references, parse_reference
 from openlp.plugins.bibles.lib.db import BibleDB, Model, init_schema
 
 from .importers.csvbible import CSVBible
@@ -46,7 +46,7 @@ from .importers.zefania import ZefaniaBible
 try:
     from .importers.sword import SwordBible
 except ImportError:
-    pass
+    SwordBible = None
 
 log = logging.getLogger(__name__)
 
@@ -71,37 +71,26 @@ class BibleFormat(object):
 
         :param bible_format: The Bible format.
         """
-        if bible_format == BibleFormat.OSIS:
-            return OSISBible
-        elif bible_format == BibleFormat.CSV:
-            return CSVBible
-        elif bible_format == BibleFormat.OpenSong:
-            return OpenSongBible
-        elif bible_format == BibleFormat.WebDownload:
-            return HTTPBible
-        elif bible_format == BibleFormat.Zefania:
-            return ZefaniaBible
-        elif bible_format == BibleFormat.SWORD:
-            return SwordBible
-        elif bible_format == BibleFormat.WordProject:
-            return WordProjectBible
-        else:
-            return None
+        return BIBLE_FORMAT_CLASSES.get(bible_format)
 
     @staticmethod
     def get_formats_list():
         """
         Return a list of the supported Bible formats.
         """
-        return [
-            BibleFormat.OSIS,
-            BibleFormat.CSV,
-            BibleFormat.OpenSong,
-            BibleFormat.WebDownload,
-            BibleFormat.Zefania,
-            BibleFormat.SWORD,
-            BibleFormat.WordProject
-        ]
+        return list(BIBLE_FORMAT_CLASSES)
+
+
+# The importer class for each Bible format. SWORD Bibles can only be imported when pysword is installed.
+BIBLE_FORMAT_CLASSES = {bible_format: class_ for bible_format, class_ in (
+    (BibleFormat.OSIS, OSISBible),
+    (BibleFormat.CSV, CSVBible),
+    (BibleFormat.OpenSong, OpenSongBible),
+    (BibleFormat.WebDownload, HTTPBible),
+    (BibleFormat.Zefania, ZefaniaBible),
+    (BibleFormat.SWORD, SwordBible),
+    (BibleFormat.WordProject, WordProjectBible)
+) if class_ is not None}
 
 
 class BibleManager(LogMixin, RegistryProperties):
@@ -122,16 +111,39 @@ class BibleManager(LogMixin, RegistryProperties):
 
         self.web = 'Web'
         self.db_cache = None
+        self.book_name_languages = {}
         self.path = AppLocation.get_section_data_path('bibles')
         self.model_path = AppLocation.get_section_data_path('models')
         self.encoder_model = None
         self.transcriber_model = None
         self.suffix = '.sqlite'
         self.import_wizard = None
-        self.model_manager = DBManager('models', init_schema)
+        # The models database is only opened the first time it is needed, see model_manager
+        self._model_manager = None
+        self._model_manager_lock = threading.Lock()
+        # The model names returned by get_models, keyed by the type and whether they are downloaded
+        self.model_names = {}
+        self.loaded_models = {}
+        ModelInfo.refresh()
         self.reload_bibles()
         self.media = None
 
+    @property
+    def model_manager(self):
+        """
+        The database manager for the models, created on first use so that starting up does not open the models
+        database when no models are used.
+        """
+        if self._model_manager is None:
+            with self._model_manager_lock:
+                if self._model_manager is None:
+                    self._model_manager = DBManager('models', init_schema)
+        return self._model_manager
+
+    @model_manager.setter
+    def model_manager(self, manager):
+        self._model_manager = manager
+
     def reload_bibles(self):
         """
         Reloads the Bibles from the available Bible databases on disk. If a web Bible is encountered, an instance
@@ -141,31 +153,44 @@ class BibleManager(LogMixin, RegistryProperties):
         file_paths = AppLocation.get_files('bibles', self.suffix)
         if Path('alternative_book_names.sqlite') in file_paths:
             file_paths.remove(Path('alternative_book_names.sqlite'))
-        log.debug('Bible Files {text}'.format(text=file_paths))
+        log.debug('Bible Files %s', file_paths)
         self.db_cache = {}
+        self.book_name_languages = {}
+        clear_parsed_references()
         for file_path in file_paths:
             bible = BibleDB(self.parent, path=self.path, file=file_path)
             if not bible.session:
                 continue
-            name = bible.get_name()
+            meta = bible.get_meta_values(['name', 'download_source', 'download_name'])
+            name = meta.get('name')
             # Remove corrupted files.
             if name is None:
-                bible.session.close()
-                bible.session = None
-                gc.collect()
+                self._close_bible(bible)
                 delete_file(self.path / file_path)
                 continue
-            log.debug('Bible Name: "{name}"'.format(name=name))
+            log.debug('Bible Name: "%s"', name)
+            bible._is_web_bible = 'download_source' in meta
             self.db_cache[name] = bible
             # Look to see if lazy load bible exists and get create getter.
-            if self.db_cache[name].is_web_bible:
-                source = self.db_cache[name].get_object(bible.BibleMeta, 'download_source')
-                download_name = self.db_cache[name].get_object(bible.BibleMeta, 'download_name').value
-                web_bible = HTTPBible(self.parent, path=self.path, file=file_path, download_source=source.value,
-                                      download_name=download_name)
+            if bible.is_web_bible:
+                web_bible = HTTPBible(self.parent, path=self.path, file=file_path,
+                                      download_source=meta['download_source'], download_name=meta['download_name'])
                 self.db_cache[name] = web_bible
         log.debug('Bibles reloaded')
 
+    @staticmethod
+    def _close_bible(bible):
+        """
+        Close the database of a bible, so that its file can be deleted. The engine is disposed of as well as closing
+        the session, because the engine keeps its connection to the file open until then.
+
+        :param bible: The bible to close.
+        """
+        engine = bible.session.get_bind()
+        bible.session.close()
+        bible.session = None
+        engine.dispose()
+
     def set_process_dialog(self, wizard):
         """
         Sets the reference to the dialog with the progress bar on it.
@@ -188,22 +213,17 @@ class BibleManager(LogMixin, RegistryProperties):
         self.db_cache[name] = importer
         return importer
 
-    def import_model(self, model, **kwargs):
-        model.register(self.import_wizard)
-        model.download()
-        self.save_model(model)
-
     def delete_bible(self, name):
         """
         Delete a bible completely.
 
         :param name: The name of the bible.
         """
-        log.debug('BibleManager.delete_bible("{name}")'.format(name=name))
+        log.debug('BibleManager.delete_bible("%s")', name)
         bible = self.db_cache[name]
-        bible.session.close()
-        bible.session = None
-        gc.collect()
+        self.book_name_languages.pop(name, None)
+        clear_parsed_references()
+        self._close_bible(bible)
         return delete_file(bible.path / '{name}{suffix}'.format(name=name, suffix=self.suffix))
 
     def get_bibles(self):
@@ -219,14 +239,16 @@ class BibleManager(LogMixin, RegistryProperties):
 
         :param bible: Unicode. The Bible to get the list of books from.
         """
-        log.debug('BibleManager.get_books("{bible}")'.format(bible=bible))
+        log.debug('BibleManager.get_books("%s")', bible)
+        bible_db = self.db_cache[bible]
+        chapter_counts = bible_db.get_chapter_counts()
         return [
             {
                 'name': book.name,
                 'book_reference_id': book.book_reference_id,
-                'chapters': self.db_cache[bible].get_chapter_count(book)
+                'chapters': chapter_counts.get(book.book_reference_id, 0)
             }
-            for book in self.db_cache[bible].get_books()
+            for book in bible_db.get_books()
         ]
 
     def get_book_by_id(self, bible, id):
@@ -236,7 +258,7 @@ class BibleManager(LogMixin, RegistryProperties):
         :param bible: Unicode. The Bible to get the list of books from.
         :param id: Unicode. The book_reference_id to get the book for.
         """
-        log.debug('BibleManager.get_book_by_id("{bible}", "{ref}")'.format(bible=bible, ref=id))
+        log.debug('BibleManager.get_book_by_id("%s", "%s")', bible, id)
         return self.db_cache[bible].get_book_by_book_ref_id(id)
 
     def get_chapter_count(self, bible, book):
@@ -246,20 +268,19 @@ class BibleManager(LogMixin, RegistryProperties):
         :param bible: Unicode. The Bible to get the list of books from.
         :param book: The book object to get the chapter count for.
         """
-        log.debug('BibleManager.get_book_chapter_count ("{bible}", "{name}")'.format(bible=bible, name=book.name))
+        log.debug('BibleManager.get_book_chapter_count ("%s", "%s")', bible, book.name)
         return self.db_cache[bible].get_chapter_count(book)
 
     def get_verse_count(self, bible, book, chapter):
         """
         Returns all the number of verses for a given book and chapterMaxBibleBookVerses.
         """
-        log.debug('BibleManager.get_verse_count("{bible}", "{book}", {chapter})'.format(bible=bible,
-                                                                                        book=book,
-                                                                                        chapter=chapter))
+        log.debug('BibleManager.get_verse_count("%s", "%s", %s)', bible, book, chapter)
         language_selection = self.get_language_selection(bible)
-        book_ref_ids = self.db_cache[bible].get_book_ref_id_by_localised_name(book, language_selection)
+        bible_db = self.db_cache[bible]
+        book_ref_ids = bible_db.get_book_ref_id_by_localised_name(book, language_selection)
         if book_ref_ids:
-            return self.db_cache[bible].get_verse_count(book_ref_ids[0], chapter)
+            return bible_db.get_verse_count(book_ref_ids[0], chapter)
         return 0
 
     def get_verse_count_by_book_ref_id(self, bible, book_ref_id, chapter):
@@ -267,8 +288,7 @@ class BibleManager(LogMixin, RegistryProperties):
         Returns all the number of verses for a given
         book_ref_id and chapterMaxBibleBookVerses.
         """
-        log.debug('BibleManager.get_verse_count_by_book_ref_id("{bible}", '
-                  '"{book}", "{chapter}")'.format(bible=bible, book=book_ref_id, chapter=chapter))
+        log.debug('BibleManager.get_verse_count_by_book_ref_id("%s", "%s", "%s")', bible, book_ref_id, chapter)
         return self.db_cache[bible].get_verse_count(book_ref_id, chapter)
 
     def parse_ref(self, bible, reference_text, book_ref_id=False):
@@ -308,14 +328,16 @@ class BibleManager(LogMixin, RegistryProperties):
 
         :param bible:  Unicode. The Bible to get the language selection from.
         """
-        log.debug('BibleManager.get_language_selection("{bible}")'.format(bible=bible))
-        language_selection = self.get_meta_data(bible, 'book_name_language')
-        if not language_selection or language_selection.value == "None" or language_selection.value == "-1":
+        log.debug('BibleManager.get_language_selection("%s")', bible)
+        # The book name language of each bible only changes in save_meta_data, so only read it from the database once
+        if bible not in self.book_name_languages:
+            book_name_language = self.get_meta_data(bible, 'book_name_language')
+            self.book_name_languages[bible] = book_name_language.value if book_name_language else None
+        language_selection = self.book_name_languages[bible]
+        if language_selection is None or language_selection == "None" or language_selection == "-1":
             # If None is returned, it's not the singleton object but a
             # BibleMeta object with the value "None"
             language_selection = Registry().get('settings').value('bibles/book name language')
-        else:
-            language_selection = language_selection.value
         try:
             language_selection = int(language_selection)
         except (ValueError, TypeError):
@@ -331,7 +353,7 @@ class BibleManager(LogMixin, RegistryProperties):
         :return: The search results if valid, or None if the search is invalid.
         :rtype: None | list
         """
-        log.debug('BibleManager.verse_search("{bible}", "{text}")'.format(bible=bible, text=text))
+        log.debug('BibleManager.verse_search("%s", "%s")', bible, text)
         if not text:
             return None
         # If no bibles are installed, message is given.
@@ -340,8 +362,9 @@ class BibleManager(LogMixin, RegistryProperties):
                 UiStrings().BibleNoBiblesTitle,
                 UiStrings().BibleNoBibles)
             return None
+        bible_db = self.db_cache[bible]
         # Check if the bible or second_bible is a web bible.
-        if self.db_cache[bible].is_web_bible:
+        if bible_db.is_web_bible:
             # If either Bible is Web, cursor is reset to normal and message is given.
             self.application.set_normal_cursor()
             self.main_window.information_message(
@@ -352,43 +375,32 @@ class BibleManager(LogMixin, RegistryProperties):
             )
             return None
         # Fetch the results from db. If no results are found, return None, no message is given for this.
-        if text:
-            return self.db_cache[bible].verse_search(text)
-        else:
-            return None
+        return bible_db.verse_search(text)
 
     def process_verse_range(self, book_ref_id, chapter_from, verse_from, chapter_to, verse_to):
-        verse_ranges = []
-        for chapter in range(chapter_from, chapter_to + 1):
-            if chapter == chapter_from:
-                start_verse = verse_from
-            else:
-                start_verse = 1
-            if chapter == chapter_to:
-                end_verse = verse_to
-            else:
-                end_verse = -1
-            verse_ranges.append((book_ref_id, chapter, start_verse, end_verse))
-        return verse_ranges
+        return [(book_ref_id, chapter, verse_from if chapter == chapter_from else 1,
+                 verse_to if chapter == chapter_to else -1)
+                for chapter in range(chapter_from, chapter_to + 1)]
 
     def save_meta_data(self, bible, version, copyright, permissions, full_license, book_name_language=None):
         """
         Saves the bibles meta data.
         """
-        log.debug('save_meta data {bible}, {version}, {copyright},'
-                  ' {perms}, {full_license}'.format(bible=bible, version=version, copyright=copyright,
-                                                    perms=permissions, full_license=full_license))
-        self.db_cache[bible].save_meta('name', version)
-        self.db_cache[bible].save_meta('copyright', copyright)
-        self.db_cache[bible].save_meta('permissions', permissions)
-        self.db_cache[bible].save_meta('full_license', full_license)
-        self.db_cache[bible].save_meta('book_name_language', book_name_language)
+        log.debug('save_meta data %s, %s, %s, %s, %s', bible, version, copyright, permissions, full_license)
+        bible_db = self.db_cache[bible]
+        bible_db.save_meta('name', version)
+        bible_db.save_meta('copyright', copyright)
+        bible_db.save_meta('permissions', permissions)
+        bible_db.save_meta('full_license', full_license)
+        bible_db.save_meta('book_name_language', book_name_language)
+        self.book_name_languages.pop(bible, None)
+        clear_parsed_references()
 
     def get_meta_data(self, bible, key):
         """
         Returns the meta data for a given key.
         """
-        log.debug('get_meta {bible},{key}'.format(bible=bible, key=key))
+        log.debug('get_meta %s,%s', bible, key)
         bible_db = self.db_cache[bible]
         return bible_db.get_object(bible_db.BibleMeta, key)
 
@@ -396,8 +408,9 @@ class BibleManager(LogMixin, RegistryProperties):
         """
         Update a book of the bible.
         """
-        log.debug('BibleManager.update_book("{bible}", "{name}")'.format(bible=bible, name=book.name))
+        log.debug('BibleManager.update_book("%s", "%s")', bible, book.name)
         self.db_cache[bible].update_book(book)
+        clear_parsed_references()
 
     def save_model(self, model):
         """
@@ -410,15 +423,18 @@ class BibleManager(LogMixin, RegistryProperties):
         db_model = self.model_manager.get_object_filtered(Model, Model.name == model.name)
         db_model = Model() if db_model is None else db_model
         db_model.name = model.name
-        db_model.type = model_info.get('type')
-        db_model.library = model_info.get('library')
-        db_model.description = model_info.get('description')
+        db_model.type = model_info.type
+        db_model.library = model_info.library
+        db_model.description = model_info.description
         db_model.path = str(model.path)
         if model.is_downloaded() and db_model.download_date is None:
             db_model.download_date = datetime.datetime.now()
         db_model.download_source = model.url
         db_model.meta = model.model_info
         self.model_manager.save_object(db_model)
+        self.model_names = {}
+        # The model may have been downloaded again somewhere else, so the next load_model must use the new details
+        self.unload_model(model.name)
 
     def get_models(self, type: ModelType | None = None, downloaded: bool = True):
         """
@@ -428,13 +444,15 @@ class BibleManager(LogMixin, RegistryProperties):
         :param downloaded: Whether to get only downloaded models.
         :return: A list of available model names.
         """
-        clauses = []
-        if downloaded:
-            clauses.append(Model.download_date.isnot_(None))
-        if type is not None:
-            clauses.append(Model.type == type)
-        models = self.model_manager.get_all_objects(Model, filter_clause=and_(*clauses))
-        return [model.name for model in models]
+        if (type, downloaded) not in self.model_names:
+            clauses = []
+            if downloaded:
+                clauses.append(Model.download_date.is_not(None))
+            if type is not None:
+                clauses.append(Model.type == type)
+            models = self.model_manager.get_all_objects(Model, filter_clause=and_(*clauses))
+            self.model_names[(type, downloaded)] = [model.name for model in models]
+        return list(self.model_names[(type, downloaded)])
 
     def load_model(self, model_name):
         """
@@ -443,10 +461,31 @@ class BibleManager(LogMixin, RegistryProperties):
         :param model_name: The name of the model to load.
         :return: The model object.
         """
+        # Loading a model reads all of its weights, so keep the models which have already been loaded
+        if model_name in self.loaded_models:
+            return self.loaded_models[model_name]
         db_model = self.model_manager.get_object_filtered(Model, Model.name == model_name)
         if db_model is None:
             return None
-        
+        model_class = db_model.library.model_class
+        if model_class is None:
+            return None
+        model = model_class(db_model.name, self, path=Path(db_model.path), url=db_model.download_source,
+                            **(db_model.meta or {}))
+        model.load()
+        self.loaded_models[model_name] = model
+        return model
+
+    def unload_model(self, model_name):
+        """
+        Unload a model which was loaded by ``load_model``, to free its memory.
+
+        :param model_name: The name of the model to unload.
+        """
+        model = self.loaded_models.pop(model_name, None)
+        if model is not None:
+            log.debug('Unloading %s model', model_name)
+            model.destroy()
 
     def exists(self, name):
         """
@@ -454,20 +493,16 @@ class BibleManager(LogMixin, RegistryProperties):
         """
         if not isinstance(name, str):
             name = str(name)
-        for bible in list(self.db_cache.keys()):
-            log.debug('Bible from cache in is_new_bible {bible}'.format(bible=bible))
-            if not isinstance(bible, str):
-                bible = str(bible)
-            if bible == name:
-                return True
-        return False
+        return name in self.db_cache
 
     def finalise(self):
         """
-        Loop through the databases to VACUUM them.
+        Loop through the databases to VACUUM them, and unload any loaded models.
         """
         for bible in self.db_cache:
             self.db_cache[bible].finalise()
+        for model_name in list(self.loaded_models):
+            self.unload_model(model_name)
 
 
 __all__ = ['BibleFormat', 'BibleManager']
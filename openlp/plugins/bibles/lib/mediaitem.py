@@ -39,7 +39,7 @@ from openlp.core.widgets.edits import SearchEdit
 from openlp.plugins.bibles.forms.bibleimportform import BibleImportForm
 from openlp.plugins.bibles.forms.editbibleform import EditBibleForm
 from openlp.plugins.bibles.forms.modeldownloadform import ModelDownloadForm
-from openlp.plugins.bibles.lib import get_reference_match, get_reference_separator
+from openlp.plugins.bibles.lib import get_reference_match, get_reference_separator, normalise_reference
 from openlp.plugins.bibles.lib.versereferencelist import VerseReferenceList
 
 log = logging.getLogger(__name__)
@@ -839,7 +839,7 @@ class BibleMediaItem(MediaManagerItem):
             return
         self.on_results_view_tab_total_update(ResultsTab.Search)
         if self.search_edit.current_search_type() == BibleSearch.Reference:
-            if get_reference_match('full').match(text):
+            if get_reference_match('full').fullmatch(normalise_reference(text)):
                 # Valid reference found. Do reference search.
                 self.text_reference_search(text)
             elif self.search_status == SearchStatus.SearchButton:
@@ -849,7 +849,8 @@ class BibleMediaItem(MediaManagerItem):
                               '<strong>The reference you typed is invalid!<br><br>'
                               'Please make sure that your reference follows one of these patterns:</strong><br><br>%s')
                     % UiStrings().BibleScriptureError % get_reference_separators())
-        elif self.search_edit.current_search_type() == BibleSearch.Combined and get_reference_match('full').match(text):
+        elif self.search_edit.current_search_type() == BibleSearch.Combined and \
+                get_reference_match('full').fullmatch(normalise_reference(text)):
             # Valid reference found. Do reference search.
             self.text_reference_search(text)
         else:
@@ -19,25 +19,113 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>. #
 ##########################################################################
 
+import hashlib
+import json
 import logging
+import os
+import re
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List
+from urllib.parse import urlparse
 
 from PySide6 import QtCore
 import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from openlp.core.common.httputils import CONNECTION_RETRIES, CONNECTION_TIMEOUT, get_proxy_settings
 from openlp.core.common.i18n import translate
 from openlp.core.common.mixins import LogMixin, RegistryProperties
 from openlp.core.common.registry import Registry
+from openlp.core.threading import ThreadWorker
 
 
 log = logging.getLogger(__name__)
 
+DOWNLOAD_PROGRESS_BYTES = 10 * 1024 * 1024
+# Files at least this big are downloaded in DOWNLOAD_PARTS parts at once, when the server supports ranged requests
+PARALLEL_DOWNLOAD_MIN_BYTES = 64 * 1024 * 1024
+DOWNLOAD_PARTS = 4
+# Matches the SHA-256 checksum that some model URLs, such as the Whisper ones, have as a folder in their path
+URL_SHA256_PATTERN = re.compile(r'/(?P<sha256>[0-9a-f]{64})/')
+
+
+@lru_cache(maxsize=1)
+def get_download_session():
+    """
+    Get the session shared by all the model downloads, so that downloads from the same host reuse their connections.
+    Requests which can't connect, or get a 502, 503 or 504 response, are retried with a short backoff.
+
+    :return: The shared :class:`requests.Session`.
+    """
+    adapter = HTTPAdapter(pool_maxsize=DOWNLOAD_PARTS * 2,
+                          max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=(502, 503, 504),
+                                            allowed_methods=('GET', 'HEAD'), raise_on_status=False))
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+@lru_cache(maxsize=1)
+def has_nvidia_gpu():
+    """
+    Check if there is an NVIDIA GPU. This can't change while OpenLP is running, so it is only checked once. On Linux
+    the device file is checked first, to avoid starting nvidia-smi.
+
+    :return: True if there is an NVIDIA GPU, otherwise False.
+    """
+    if os.path.exists('/dev/nvidia0'):
+        return True
+    try:
+        subprocess.check_output('nvidia-smi')
+        return True
+    except Exception:
+        # this command not being found can raise quite a few different errors depending on the configuration
+        return False
+
+
+class ModelDownloadWorker(ThreadWorker):
+    """
+    This worker allows a model to be downloaded in a thread
+    """
+    download_finished = QtCore.Signal(bool)
+
+    def __init__(self, model):
+        """
+        Set up the worker object
+
+        :param model: The model to download.
+        """
+        self.model = model
+        super().__init__()
+
+    def start(self):
+        """
+        Download the model, and report whether the download succeeded
+        """
+        is_success = False
+        try:
+            if not self.model.stop_import_flag:
+                self.model.download()
+                is_success = not self.model.stop_import_flag
+        except Exception:
+            log.exception('Unable to download model %s', self.model.name)
+        finally:
+            self.download_finished.emit(is_success)
+            self.quit.emit()
+
 
 class ModelBase(QtCore.QObject, LogMixin, RegistryProperties):
     """
     This class is used as a base class for models.
     """
+    download_progress = QtCore.Signal(int)
 
     def __init__(self, name: str, *args, **kwargs):
         """
@@ -73,6 +161,183 @@ class ModelBase(QtCore.QObject, LogMixin, RegistryProperties):
         """
         pass
 
+    def download_file(self, url, file_path):
+        """
+        Download a single file of the model. The file is downloaded to a ``.part`` file next to ``file_path``, which
+        is renamed once the download is complete. An interrupted download is resumed with a ranged request, using the
+        ETag or Last-Modified validators stored in a ``.meta.json`` file to make sure the remote file has not changed.
+
+        :param url: The URL to download.
+        :param file_path: The path to save the file to.
+        :return: True if the file was downloaded completely, otherwise False.
+        """
+        part_path = file_path.with_name(file_path.name + '.part')
+        meta_path = file_path.with_name(file_path.name + '.meta.json')
+        headers = {}
+        if part_path.exists() and meta_path.exists():
+            try:
+                validator = json.loads(meta_path.read_text()).get('validator')
+            except (OSError, ValueError):
+                validator = None
+            if validator:
+                headers['Range'] = 'bytes={size}-'.format(size=part_path.stat().st_size)
+                headers['If-Range'] = validator
+        if not headers:
+            # Nothing to resume, so try to download the file in several parts at once. Any old validator is removed
+            # first so that a partly downloaded file from here is never resumed as if it were a single stream.
+            meta_path.unlink(missing_ok=True)
+            is_downloaded = self._download_file_in_parts(url, part_path)
+            if is_downloaded is not None:
+                if is_downloaded:
+                    self._finish_download(url, part_path, file_path)
+                return is_downloaded
+        with get_download_session().get(url, headers=headers, proxies=get_proxy_settings(),
+                                        timeout=float(CONNECTION_TIMEOUT), stream=True) as response:
+            if headers and response.status_code == 416:
+                # The .part file is already as big as the remote file, for example because OpenLP was closed just
+                # before it was renamed, so there is nothing left to resume and the download is started again
+                log.debug('Unable to resume the download of %s, starting it again', url)
+                response.close()
+                part_path.unlink(missing_ok=True)
+                meta_path.unlink(missing_ok=True)
+                return self.download_file(url, file_path)
+            response.raise_for_status()
+            is_resumed = response.status_code == 206
+            if not is_resumed:
+                validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+                meta_path.write_text(json.dumps({'url': url, 'validator': validator}))
+            log.debug('%s %s', 'Resuming download of' if is_resumed else 'Downloading', url)
+            downloaded = part_path.stat().st_size if is_resumed else 0
+            total = downloaded + int(response.headers.get('Content-Length', 0))
+            last_emit_bytes = downloaded
+            last_emit_percent = -1
+            with part_path.open('ab' if is_resumed else 'wb') as part_file:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    if self.stop_import_flag:
+                        return False
+                    part_file.write(chunk)
+                    downloaded += len(chunk)
+                    if not total:
+                        continue
+                    # Only report progress when the percentage changes or every 10 MB, to avoid flooding the GUI
+                    # thread with queued signals
+                    percent = downloaded * 100 // total
+                    if percent != last_emit_percent or downloaded - last_emit_bytes >= DOWNLOAD_PROGRESS_BYTES:
+                        self.download_progress.emit(percent)
+                        last_emit_bytes = downloaded
+                        last_emit_percent = percent
+        meta_path.unlink(missing_ok=True)
+        self._finish_download(url, part_path, file_path)
+        return True
+
+    def _finish_download(self, url, part_path, file_path):
+        """
+        Check a downloaded file against the SHA-256 checksum in its URL, if it has one, and move it into place. A file
+        which does not match is deleted, so that it is downloaded again next time.
+
+        :param url: The URL the file was downloaded from.
+        :param part_path: The path of the downloaded ``.part`` file.
+        :param file_path: The path to move the file to.
+        """
+        match = URL_SHA256_PATTERN.search(urlparse(url).path)
+        if match:
+            sha256 = hashlib.sha256()
+            with part_path.open('rb') as part_file:
+                for chunk in iter(lambda: part_file.read(1024 * 1024), b''):
+                    sha256.update(chunk)
+            if sha256.hexdigest() != match.group('sha256'):
+                part_path.unlink()
+                raise ValueError('The file downloaded from {url} does not match its checksum'.format(url=url))
+            log.debug('Checked the checksum of %s', file_path.name)
+        part_path.replace(file_path)
+
+    def _download_file_in_parts(self, url, part_path):
+        """
+        Download a large file with several ranged requests at once, which is usually much faster than a single stream.
+        Each part is written straight to its place in the ``.part`` file. No validator is stored for the file, so an
+        interrupted download is started again rather than resumed.
+
+        :param url: The URL to download.
+        :param part_path: The path of the ``.part`` file to download to.
+        :return: True if the file was downloaded, False if the download was stopped, or None if the file should be
+            downloaded with a single request instead, because the server does not support ranged requests or the file
+            changed during the download.
+        """
+        proxies = get_proxy_settings()
+        session = get_download_session()
+        response = session.head(url, proxies=proxies, timeout=float(CONNECTION_TIMEOUT), allow_redirects=True)
+        total = int(response.headers.get('Content-Length', 0))
+        if not response.ok or response.headers.get('Accept-Ranges') != 'bytes' or total < PARALLEL_DOWNLOAD_MIN_BYTES:
+            return None
+        # Make sure that every part comes from the same version of the file
+        validator = response.headers.get('ETag') or response.headers.get('Last-Modified')
+        url = response.url
+        log.debug('Downloading %s in %d parts', url, DOWNLOAD_PARTS)
+        with part_path.open('wb') as part_file:
+            part_file.truncate(total)
+        progress = {'downloaded': 0, 'last_emit_bytes': 0, 'last_emit_percent': -1}
+        progress_lock = threading.Lock()
+        failed = threading.Event()
+
+        def report_progress(size):
+            with progress_lock:
+                progress['downloaded'] += size
+                percent = progress['downloaded'] * 100 // total
+                if percent != progress['last_emit_percent'] or \
+                        progress['downloaded'] - progress['last_emit_bytes'] >= DOWNLOAD_PROGRESS_BYTES:
+                    self.download_progress.emit(percent)
+                    progress['last_emit_bytes'] = progress['downloaded']
+                    progress['last_emit_percent'] = percent
+
+        def download_part(start, end):
+            offset = start
+            retries = 0
+            try:
+                with part_path.open('r+b') as part_file:
+                    while offset <= end:
+                        headers = {'Range': 'bytes={start}-{end}'.format(start=offset, end=end)}
+                        if validator:
+                            headers['If-Range'] = validator
+                        try:
+                            with session.get(url, headers=headers, proxies=proxies,
+                                             timeout=float(CONNECTION_TIMEOUT), stream=True) as part_response:
+                                part_response.raise_for_status()
+                                if part_response.status_code != 206:
+                                    # The whole file was sent because it changed, or its validator is weak and
+                                    # never matches If-Range, so stop the other parts and use a single request
+                                    log.debug('%s did not return a part, downloading it in one go', url)
+                                    failed.set()
+                                    return None
+                                part_file.seek(offset)
+                                for chunk in part_response.iter_content(chunk_size=1024 * 1024):
+                                    if self.stop_import_flag or failed.is_set():
+                                        return False
+                                    part_file.write(chunk)
+                                    offset += len(chunk)
+                                    report_progress(len(chunk))
+                        except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError,
+                                requests.exceptions.Timeout):
+                            # Carry on from where this part got to, backing off a little more each time
+                            if retries >= CONNECTION_RETRIES:
+                                raise
+                            retries += 1
+                            time.sleep(2 ** retries)
+                return True
+            except Exception:
+                failed.set()
+                raise
+
+        part_size = -(-total // DOWNLOAD_PARTS)
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_PARTS) as executor:
+            futures = [executor.submit(download_part, start, min(start + part_size, total) - 1)
+                       for start in range(0, total, part_size)]
+            results = [future.result() for future in futures]
+        if self.stop_import_flag:
+            return False
+        if None in results:
+            return None
+        return all(results)
+
     def is_downloaded(self):
         """
         Check if the model is already downloaded. This method must be overridden by descendant classes.
@@ -129,12 +394,7 @@ class ModelBase(QtCore.QObject, LogMixin, RegistryProperties):
 
         :return: True if the model has GPU support, otherwise False.
         """
-        try:
-            subprocess.check_output('nvidia-smi')
-            return True
-        except Exception:
-            # this command not being found can raise quite a few different errors depending on the configuration
-            return False
+        return has_nvidia_gpu()
 
     def destroy(self):
         """
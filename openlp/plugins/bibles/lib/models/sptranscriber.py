@@ -20,6 +20,7 @@
 ##########################################################################
 
 import logging
+import os
 
 import numpy as np
 from speechbrain.inference.ASR import EncoderDecoderASR
@@ -30,6 +31,9 @@ from openlp.plugins.bibles.lib.model import TranscriberModel
 
 log = logging.getLogger(__name__)
 
+# The files which every downloaded SpeechBrain model has
+REQUIRED_FILES = frozenset(("hyperparams.yaml", "custom.py"))
+
 
 class SpeechBrainTranscriberModel(TranscriberModel):
     def __init__(self, name: str, manager, *args, **kwargs):
@@ -43,6 +47,9 @@ class SpeechBrainTranscriberModel(TranscriberModel):
         """
         log.debug("Loading SpeechBrainTranscriberModel: %s", name)
         super().__init__(name, manager, *args, **kwargs)
+        # Every call transcribes a single full length clip, so the relative lengths never change
+        self._lengths = torch.tensor([1.0])
+        self.gpu = torch.cuda.is_available()
 
     def _get_repo_id(self):
         """
@@ -50,7 +57,7 @@ class SpeechBrainTranscriberModel(TranscriberModel):
 
         :return: The repository ID.
         """
-        return self.url.replace("https://huggingface.co/", "")
+        return self.url.removeprefix("https://huggingface.co/").strip("/")
 
     def download(self):
         """
@@ -67,12 +74,11 @@ class SpeechBrainTranscriberModel(TranscriberModel):
 
         :return: True if the model is downloaded, False otherwise.
         """
-        # check if repo has hyperparams.yaml and custom.py
-        if not self.path.exists():
+        # check if repo has hyperparams.yaml and custom.py, listing the folder once rather than checking each file
+        try:
+            return REQUIRED_FILES.issubset(os.listdir(self.path))
+        except (FileNotFoundError, NotADirectoryError):
             return False
-        hyperparams = self.path / "hyperparams.yaml"
-        custom = self.path / "custom.py"
-        return hyperparams.exists() and custom.exists()
 
     def load(self):
         """
@@ -84,7 +90,9 @@ class SpeechBrainTranscriberModel(TranscriberModel):
             if not self.is_downloaded():
                 self.download()
             log.debug("Loading SpeechBrainTranscriberModel: %s", self.name)
-            self.model = EncoderDecoderASR.from_hparams(source=self.path)
+            # SpeechBrain runs on the CPU unless it is told otherwise
+            self.model = EncoderDecoderASR.from_hparams(source=self.path,
+                                                        run_opts={'device': 'cuda' if self.gpu else 'cpu'})
 
     def transcribe(self, audio: np.ndarray, *args, **kwargs) -> str:
         """
@@ -92,13 +100,16 @@ class SpeechBrainTranscriberModel(TranscriberModel):
 
         :param audio: The audio.
         :param args: The arguments.
-        :param kwargs: The keyword arguments.
+        :param kwargs: The keyword arguments. Pass ``fp16=False`` to transcribe at full precision on the GPU.
         :return: The transcription.
         """
         if not self.model:
             self.load()
-        # convert audio to tensor
-        audio = torch.tensor(audio).unsqueeze(0)
-        lengths = torch.tensor([1.0])
-        texts, _ = self.model.transcribe_batch(audio, lengths)
+        # convert audio to tensor, sharing the array's memory rather than copying it
+        audio = torch.from_numpy(np.ascontiguousarray(audio, dtype=np.float32)).unsqueeze(0)
+        # Like Whisper, use half precision on the GPU, where it is considerably faster. Nothing is ever trained, so
+        # inference mode also skips the autograd bookkeeping which no_grad still does
+        with torch.inference_mode(), \
+                torch.autocast('cuda', dtype=torch.float16, enabled=self.gpu and kwargs.get('fp16', True)):
+            texts, _ = self.model.transcribe_batch(audio, self._lengths)
         return texts[0]
@@ -20,13 +20,14 @@
 ##########################################################################
 
 import logging
+from importlib.util import find_spec
 from typing import List
 
 from huggingface_hub import snapshot_download
 import numpy as np
+import torch
 from sentence_transformers import SentenceTransformer
 from sentence_transformers.util import (
-    cos_sim,
     get_device_name,
     is_sentence_transformer_model,
 )
@@ -36,6 +37,9 @@ from openlp.plugins.bibles.lib.model import EncoderModel
 
 log = logging.getLogger(__name__)
 
+# ONNX Runtime runs the models noticeably faster than PyTorch on the CPU, when it and optimum are installed
+HAS_ONNX_RUNTIME = find_spec('onnxruntime') is not None and find_spec('optimum') is not None
+
 
 class SentenceTransformerEncoderModel(EncoderModel):
     def __init__(self, name: str, manager, *args, **kwargs):
@@ -49,6 +53,9 @@ class SentenceTransformerEncoderModel(EncoderModel):
         """
         log.debug("Loading SentenceTransformerEncoderModel: %s", name)
         super().__init__(name, manager, *args, **kwargs)
+        self.device = None
+        # The embeddings last compared against on the GPU, and their copy on the GPU
+        self._device_embeddings = (None, None)
 
     def _get_repo_id(self):
         """
@@ -56,7 +63,7 @@ class SentenceTransformerEncoderModel(EncoderModel):
 
         :return: The repository ID.
         """
-        return self.url.replace("https://huggingface.co/", "")
+        return self.url.removeprefix("https://huggingface.co/").strip("/")
 
     def download(self):
         """
@@ -80,33 +87,59 @@ class SentenceTransformerEncoderModel(EncoderModel):
         if not self.model:
             if not self.is_downloaded():
                 self.download()
+            self.device = get_device_name()
+            if self.device == 'cpu' and HAS_ONNX_RUNTIME:
+                try:
+                    self.model = SentenceTransformer(self.path, device=self.device, local_files_only=True,
+                                                     backend='onnx')
+                    return
+                except Exception:
+                    log.exception('Unable to load %s with ONNX Runtime, falling back to PyTorch', self.name)
             self.model = SentenceTransformer(
-                self.path, device=get_device_name(), local_files_only=True
+                self.path, device=self.device, local_files_only=True
             )
+            if self.device == 'cuda':
+                # Half precision runs on the GPU's tensor cores, at about twice the speed
+                self.model.half()
 
     def encode(self, text: str | List[str], *args, **kwargs) -> np.ndarray:
         """
         Encode the text.
 
-        :param text: The text(s) to encode.
+        :param text: The text(s) to encode. Lists are encoded in batches, which SentenceTransformer sorts by length
+            so that each batch needs as little padding as possible.
         :param args: The arguments.
-        :param kwargs: The keyword arguments.
-        :return: The encoded text.
+        :param kwargs: The keyword arguments. ``batch_size`` sets how many texts are encoded at once.
+        :return: The encoded text, normalised to unit length.
         """
         if not self.model:
             self.load()
-        return self.model.encode(text)
+        embeddings = self.model.encode(text, batch_size=kwargs.get('batch_size', 32), show_progress_bar=False,
+                                       normalize_embeddings=True,
+                                       convert_to_tensor=kwargs.get('convert_to_tensor', False))
+        # Embeddings from a half precision model are still stored and compared at full precision
+        return embeddings.astype(np.float32, copy=False) if isinstance(embeddings, np.ndarray) else embeddings
 
-    def similarity(self, text: str, embeddings: np.ndarray, *args, **kwargs) -> np.ndarray:
+    def similarity(self, text: str | List[str], embeddings: np.ndarray, *args, **kwargs) -> np.ndarray:
         """
         Calculate the similarity between two texts or lists of texts.
 
-        :param text: The text.
-        :param embeddings: The embeddings to compare to.
+        :param text: The text, or a list of texts which are encoded together in one batch.
+        :param embeddings: The embeddings to compare to, as returned by encode.
         :param args: The arguments.
-        :param kwargs: The keyword arguments.
-        :return: The similarities of the text to the embeddings.
+        :param kwargs: The keyword arguments, which are passed on to encode.
+        :return: The similarities of the text to the embeddings, with one row per text.
         """
         if not self.model:
             self.load()
-        return cos_sim(self.encode(text), embeddings).numpy()
+        # encode normalises every embedding, so the cosine similarity is just the dot product
+        if self.device != 'cuda':
+            return np.atleast_2d(self.encode(text, **kwargs)) @ embeddings.T
+        # On the GPU, keep the query on the device and only copy the embeddings over when they change
+        kwargs['convert_to_tensor'] = True
+        query = torch.atleast_2d(self.encode(text, **kwargs))
+        cached_embeddings, device_embeddings = self._device_embeddings
+        if cached_embeddings is not embeddings:
+            device_embeddings = torch.as_tensor(embeddings, device=query.device, dtype=query.dtype)
+            self._device_embeddings = (embeddings, device_embeddings)
+        return (query @ device_embeddings.T).float().cpu().numpy()
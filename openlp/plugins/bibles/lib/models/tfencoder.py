@@ -84,7 +84,7 @@ class TensorFlowEncoderModel(EncoderModel):
         Encode the text.
 
         :param text: The text to encode.
-        :return: The encoded text.
+        :return: The encoded text, normalised to unit length.
         """
         if not self.model:
             self.load()
@@ -92,27 +92,25 @@ class TensorFlowEncoderModel(EncoderModel):
         if isinstance(text, str):
             scalar = True
             text = [text]
-        return self.model(text).numpy()[0] if scalar else self.model(text).numpy()
+        embeddings = self.model(text).numpy()
+        # The squared row norms from einsum, and a single square root, are cheaper than np.linalg.norm
+        embeddings = embeddings / np.sqrt(np.einsum('ij,ij->i', embeddings, embeddings))[:, np.newaxis]
+        return embeddings[0] if scalar else embeddings
 
     def similarity(self, text: str, embeddings: np.ndarray, *args, **kwargs) -> np.ndarray:
         """
         Calculate the similarity between two texts or lists of texts.
 
         :param text: The text.
-        :param embeddings: The embeddings to compare to.
+        :param embeddings: The embeddings to compare to, as returned by encode.
         :param args: The arguments.
         :param kwargs: The keyword arguments.
         :return: The similarities of the text to the embeddings.
         """
         if not self.model:
             self.load()
-        text_embedding = self.encode(text)
-        if text_embedding.ndim == 1:
-            text_embedding = text_embedding.reshape(1, -1)
-        # normalize the embeddings
-        text_embedding = text_embedding / np.linalg.norm(text_embedding, ord=2, axis=1, keepdims=True)
-        embeddings = embeddings / np.linalg.norm(embeddings, ord=2, axis=1, keepdims=True)
-        return np.dot(text_embedding, embeddings.T)
+        # encode normalises every embedding, so the cosine similarity is just the dot product
+        return np.dot(np.atleast_2d(self.encode(text)), embeddings.T)
 
     def has_gpu(self):
         """
@@ -20,7 +20,6 @@
 ##########################################################################
 
 import logging
-from urllib.request import urlretrieve
 
 import numpy as np
 import torch
@@ -53,7 +52,7 @@ class WhisperTranscriberModel(TranscriberModel):
         if self.is_downloaded():
             return self.path
         log.debug("Downloading WhisperTranscriberModel: %s", self.name)
-        urlretrieve(self.url, self.filename)
+        self.download_file(self.url, self.filename)
         return self.path
 
     def is_downloaded(self):
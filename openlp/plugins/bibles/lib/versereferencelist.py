@@ -57,33 +57,30 @@ class VerseReferenceList(object):
         verse_sep = get_reference_separator('sep_v_display')
         range_sep = get_reference_separator('sep_r_display')
         list_sep = get_reference_separator('sep_l_display')
-        result = ''
+        # Collect the parts and join them once at the end, rather than reformatting the whole result for every part
+        parts = []
         for index, verse in enumerate(self.verse_list):
             if index == 0:
-                result = '{book} {chapter}{sep}{verse}'.format(book=verse['book'],
-                                                               chapter=verse['chapter'],
-                                                               sep=verse_sep,
-                                                               verse=verse['start'])
+                parts.append('{book} {chapter}{sep}{verse}'.format(book=verse['book'], chapter=verse['chapter'],
+                                                                   sep=verse_sep, verse=verse['start']))
                 if verse['start'] != verse['end']:
-                    result = '{result}{sep}{end}'.format(result=result, sep=range_sep, end=verse['end'])
+                    parts.append('{sep}{end}'.format(sep=range_sep, end=verse['end']))
                 continue
-            prev = index - 1
-            if self.verse_list[prev]['version'] != verse['version']:
-                result = '{result} ({version})'.format(result=result, version=self.verse_list[prev]['version'])
-            result += '{sep} '.format(sep=list_sep)
-            if self.verse_list[prev]['book'] != verse['book']:
-                result = '{result}{book} {chapter}{sep}'.format(result=result,
-                                                                book=verse['book'],
-                                                                chapter=verse['chapter'],
-                                                                sep=verse_sep)
-            elif self.verse_list[prev]['chapter'] != verse['chapter']:
-                result = '{result}{chapter}{sep}'.format(result=result, chapter=verse['chapter'], sep=verse_sep)
-            result += str(verse['start'])
+            prev = self.verse_list[index - 1]
+            if prev['version'] != verse['version']:
+                parts.append(' ({version})'.format(version=prev['version']))
+            parts.append('{sep} '.format(sep=list_sep))
+            if prev['book'] != verse['book']:
+                parts.append('{book} {chapter}{sep}'.format(book=verse['book'], chapter=verse['chapter'],
+                                                            sep=verse_sep))
+            elif prev['chapter'] != verse['chapter']:
+                parts.append('{chapter}{sep}'.format(chapter=verse['chapter'], sep=verse_sep))
+            parts.append(str(verse['start']))
             if verse['start'] != verse['end']:
-                result = '{result}{sep}{end}'.format(result=result, sep=range_sep, end=verse['end'])
+                parts.append('{sep}{end}'.format(sep=range_sep, end=verse['end']))
         if len(self.version_list) > 1:
-            result = '{result} ({version})'.format(result=result, version=verse['version'])
-        return result
+            parts.append(' ({version})'.format(version=verse['version']))
+        return ''.join(parts)
 
     def format_versions(self, copyright=True, permission=True):
         """
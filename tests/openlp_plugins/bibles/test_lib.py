@@ -21,6 +21,8 @@
 """
 This module contains tests for the lib submodule of the Bibles plugin.
 """
+import threading
+
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -164,7 +166,7 @@ def test_reference_matched_full(mocked_bible_test):
                         reference_text = reference_text.format(to=to, verse=verse, _and=_and, end=end)
 
                         # WHEN: Attempting to parse the input string
-                        match = full_reference_match.match(reference_text)
+                        match = full_reference_match.fullmatch(reference_text)
 
                         # THEN: A match should be returned, and the book and reference should match the
                         #       expected result
@@ -206,7 +208,7 @@ def test_reference_matched_range(mocked_bible_test):
                         reference_text = reference_text.format(to=to, verse=verse, _and=_and, end=end)
 
                         # WHEN: Attempting to parse the input string
-                        match = full_reference_match.match(reference_text)
+                        match = full_reference_match.fullmatch(reference_text)
 
                         # THEN: A match should be returned, and the to/from chapter/verses should match as
                         #       expected
@@ -218,6 +220,32 @@ def test_reference_matched_range(mocked_bible_test):
                         assert match.group('to_verse') == to_verse
 
 
+def test_reference_matched_simple(mocked_bible_test):
+    """
+    Test that the 'simple' regex only matches a single chapter, verse or range of verses in one chapter
+    """
+    # GIVEN: Some references, with the expected book, chapter and verses, or None if they should not match
+    test_data = [
+        ('John 3', ('John', '3', None, None)),
+        ('1 John 3:16', ('1 John', '3', '16', None)),
+        (' John 3 verse 16 to 18 ', ('John', '3', '16', '18')),
+        ('John 3-4', None),
+        ('John 3:16-4:1', None),
+        ('John 3:16,18', None),
+        ('John 3:16-end', None),
+        ('John 0:1', None)]
+    simple_reference_match = get_reference_match('simple')
+    for reference_text, expected_groups in test_data:
+        # WHEN: Attempting to match the reference
+        match = simple_reference_match.fullmatch(reference_text)
+
+        # THEN: Only the simple references should match, with the expected groups
+        if expected_groups is None:
+            assert match is None, '{text} should not match'.format(text=reference_text)
+        else:
+            assert match.group('book', 'chapter', 'from_verse', 'to_verse') == expected_groups
+
+
 def test_reference_matched_range_separator(mocked_bible_test):
     # GIVEN: Some test data which contains different references to parse, with the expected results.
     # The following test data tests with 111 variants when using the default 'separators'
@@ -282,10 +310,10 @@ def test_update_reference_separators_custom_seps(request, settings):
     expected_separators = {
         'sep_e': '\\s*(?:\\.)\\s*',
         'sep_e_default': 'end',
-        'sep_l': '\\s*(?:(?:[,‚]))\\s*',
+        'sep_l': '\\s*(?:,)\\s*',
         'sep_l_default': ',|and',
         'sep_l_display': ',',
-        'sep_r': '\\s*(?:(?:[-\xad‐‑‒——−﹣－]))\\s*',
+        'sep_r': '\\s*(?:-)\\s*',
         'sep_r_default': '-|to',
         'sep_r_display': '-',
         'sep_v': '\\s*(?::|v)\\s*',
@@ -293,3 +321,121 @@ def test_update_reference_separators_custom_seps(request, settings):
         'sep_v_display': ':'
     }
     assert lib.REFERENCE_SEPARATORS == expected_separators
+
+
+def test_model_info_size_mb():
+    """
+    Test that each model has a numeric size matching its size string
+    """
+    # GIVEN: The models known to ModelInfo
+    # WHEN: Getting the numeric size of each model
+    # THEN: Each model should have a numeric size matching its size string
+    for model_spec in lib.ModelInfo.all_models.values():
+        assert model_spec.size_mb == lib.get_size_from_string(model_spec.size)
+        assert isinstance(model_spec.size_mb, int)
+
+
+@pytest.mark.parametrize('size_string,unit,expected_size', [('420 MB', 'MB', 420), ('1457MB', 'MB', 1457),
+                                                            ('1.5 GB', 'MB', 1536), ('2 gb', 'MB', 2048),
+                                                            ('7', 'GB', 7168), ('unknown', 'MB', 0)])
+def test_get_size_from_string(size_string, unit, expected_size):
+    """
+    Test that sizes are read from size strings with and without spaces, units and decimals
+    """
+    # GIVEN: A size string and a default unit
+    # WHEN: Getting the size from the string
+    # THEN: The size should be given in MB
+    assert lib.get_size_from_string(size_string, unit) == expected_size
+
+
+def test_model_library_model_type():
+    """
+    Test that each model library maps to the right type of model
+    """
+    # GIVEN: The model libraries
+    # WHEN: Getting the type of model each library provides
+    # THEN: The encoder libraries should be encoders and the rest should be transcribers
+    assert lib.ModelLibrary.SENTENCE_TRANSFORMERS.model_type == lib.ModelType.ENCODER
+    assert lib.ModelLibrary.TENSORFLOW.model_type == lib.ModelType.ENCODER
+    assert lib.ModelLibrary.WHISPER.model_type == lib.ModelType.TRANSCRIBER
+    assert lib.ModelLibrary.SPEECHBRAIN.model_type == lib.ModelType.TRANSCRIBER
+
+
+def test_model_info_get_models_by_type_and_library():
+    """
+    Test that the models can be looked up by type and by library
+    """
+    # GIVEN: The models known to ModelInfo
+    # WHEN: Getting the models by type and by library
+    encoders = lib.ModelInfo.get_models_by_type(lib.ModelType.ENCODER)
+    whisper_models = lib.ModelInfo.get_models_by_library(lib.ModelLibrary.WHISPER)
+
+    # THEN: The models should match the ones in the registry
+    assert set(encoders) == set(lib.ModelInfo.embedding_models)
+    assert whisper_models
+    assert all(lib.ModelInfo.get_model_info(name).library == lib.ModelLibrary.WHISPER for name in whisper_models)
+
+
+def test_model_info_get_models_fitting():
+    """
+    Test that only the models no bigger than the given size are returned, smallest first
+    """
+    # GIVEN: The models known to ModelInfo
+    # WHEN: Getting the models which fit in 500 MB, and in no space at all
+    models = lib.ModelInfo.get_models_fitting(500)
+    no_models = lib.ModelInfo.get_models_fitting(0)
+
+    # THEN: Only the smaller models should be returned, in order of size
+    sizes = [lib.ModelInfo.get_model_info(name).size_mb for name in models]
+    assert sizes == sorted(sizes)
+    assert all(size <= 500 for size in sizes)
+    assert len(models) == sum(model_spec.size_mb <= 500 for model_spec in lib.ModelInfo.all_models.values())
+    assert no_models == ()
+
+
+@patch('openlp.plugins.bibles.lib.get_web_page')
+def test_model_info_refresh_from_manifest(mocked_get_web_page):
+    """
+    Test that the models are replaced with the ones in the model manifest, and kept if it can't be downloaded
+    """
+    # GIVEN: A manifest that can't be downloaded, and one with a single model
+    manifest = ('{"embedding_models": {"test-model": {"display_name": "test-model", "description": "Test", '
+                '"library": "sentence_transformers", "type": "encoder", "author": "OpenLP", "size": "1 MB", '
+                '"size_mb": 1, "performance": "Good", "speed": "Fast", "url": "test-model"}}, '
+                '"transcription_models": {}}')
+    with patch.multiple(lib.ModelInfo, embedding_models=lib.ModelInfo.embedding_models,
+                        transcription_models=lib.ModelInfo.transcription_models, all_models=lib.ModelInfo.all_models):
+        built_in_models = dict(lib.ModelInfo.all_models)
+
+        # WHEN: Refreshing the models from each manifest
+        mocked_get_web_page.return_value = None
+        lib.ModelInfo._refresh_from_manifest('https://example.com/models.json')
+        models_after_failure = dict(lib.ModelInfo.all_models)
+        mocked_get_web_page.return_value = manifest
+        lib.ModelInfo._refresh_from_manifest('https://example.com/models.json')
+
+        # THEN: The built in models should be kept, then replaced with the model from the manifest
+        assert models_after_failure == built_in_models
+        assert list(lib.ModelInfo.all_models) == ['test-model']
+        assert lib.ModelInfo.get_model_info('test-model').library == lib.ModelLibrary.SENTENCE_TRANSFORMERS
+    lib.ModelInfo._clear_caches()
+
+
+def test_model_info_lookups_wait_for_refresh():
+    """
+    Test that looking up a model waits while the models are being replaced, so an old result is never cached
+    """
+    # GIVEN: The models being replaced from a manifest in another thread
+    lib.ModelInfo._clear_caches()
+    results = []
+    with lib.MODEL_MANIFEST_LOCK:
+        lookup = threading.Thread(target=lambda: results.append(lib.ModelInfo.get_model_info('openai-whisper-tiny')))
+
+        # WHEN: Looking up a model
+        lookup.start()
+        lookup.join(0.1)
+
+        # THEN: The lookup should not finish until the models have been replaced
+        assert results == []
+    lookup.join()
+    assert results[0] is lib.ModelInfo.all_models['openai-whisper-tiny']
@@ -25,6 +25,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from openlp.core.common.registry import Registry
+from openlp.plugins.bibles.lib.db import BibleDB
 from openlp.plugins.bibles.lib.manager import BibleManager
 from tests.utils.constants import TEST_RESOURCES_PATH
 
@@ -49,6 +50,7 @@ def test_get_books(manager):
     books = manager.get_books('tests')
     # THEN a list of books should be returned
     assert 66 == len(books), 'There should be 66 books in the bible'
+    assert 6 == books[53]['chapters'], '1 Timothy should have 6 chapters'
 
 
 def test_get_book_by_id(manager):
@@ -74,6 +76,18 @@ def test_get_chapter_count(manager):
     assert 6 == chapter, '1 Timothy should have 6 chapters returned from the bible'
 
 
+def test_get_chapter_counts(manager):
+    """
+    Test the get_chapter_counts method of the bible database
+    """
+    # GIVEN given a bible in the bible manager, which only has verses stored for 1 Timothy
+    bible = manager.get_bibles()['tests']
+    # WHEN asking the bible database for the chapter counts of all the books
+    chapter_counts = BibleDB.get_chapter_counts(bible)
+    # THEN the highest stored chapter of each book should be returned
+    assert {54: 3} == chapter_counts, 'Only 1 Timothy should have stored chapters, up to chapter 3'
+
+
 def test_get_verse_count_by_book_ref_id(manager):
     """
     Test the get_verse_count_by_book_ref_id method
@@ -83,3 +97,15 @@ def test_get_verse_count_by_book_ref_id(manager):
     verses = manager.get_verse_count_by_book_ref_id('tests', 54, 3)
     # THEN the chapter count should be returned
     assert 16 == verses, '1 Timothy v3 should have 16 verses returned from the bible'
+
+
+def test_get_meta_values(manager):
+    """
+    Test the get_meta_values method
+    """
+    # GIVEN given a bible in the bible manager
+    bible = manager.get_bibles()['tests']
+    # WHEN asking for the name, download name and a missing key of the bible
+    meta = bible.get_meta_values(['name', 'download_name', 'missing'])
+    # THEN the values of the keys which exist should be returned
+    assert meta == {'name': 'tests', 'download_name': 'niv'}, 'The name and download name should have been returned'
@@ -185,3 +185,31 @@ def test_parse_reference_non_regexp_matching_reference(manager):
     results = parse_reference('1 Timothy', manager.db_cache['tests'], MagicMock(), 54)
     # THEN an empty verse array should be returned
     assert [] == results, "The bible verse list should be empty"
+
+
+def test_parse_reference_uses_cache(manager):
+    """
+    Test the parse_reference method only parses the same reference once
+    """
+    # GIVEN given a bible in the bible manager and a reference which has already been parsed
+    bible = manager.db_cache['tests']
+    language_selection = MagicMock()
+    first_results = parse_reference('1 Timothy 1:1-2', bible, language_selection, 54)
+    # WHEN asking to parse the same reference again
+    with patch('openlp.plugins.bibles.lib._parse_reference') as mocked_parse_reference:
+        results = parse_reference('1 Timothy 1:1-2', bible, language_selection, 54)
+    # THEN the cached results should be returned as a new list
+    assert mocked_parse_reference.call_count == 0, 'The reference should not have been parsed again'
+    assert results == first_results, 'The bible verses should match the first results'
+    assert results is not first_results, 'A copy of the cached list should be returned'
+
+
+def test_parse_reference_unicode_dash(manager):
+    """
+    Test the parse_reference method with a Unicode hyphen as the range separator, 1 Timothy 1:1‐2
+    """
+    # GIVEN given a bible in the bible manager
+    # WHEN asking to parse the bible reference
+    results = parse_reference('1 Timothy 1:1‐2', manager.db_cache['tests'], MagicMock(), 54)
+    # THEN the reference should be parsed as if it had an ASCII hyphen
+    assert [(54, 1, 1, 2)] == results, "The bible verses should match the expected results"
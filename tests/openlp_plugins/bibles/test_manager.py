@@ -37,16 +37,168 @@ def test_delete_bible(settings):
         instance = BibleManager(MagicMock())
         # We need to keep a reference to the mock for close_all as it gets set to None later on!
         mocked_close = MagicMock()
+        mocked_engine = MagicMock()
         mocked_bible = MagicMock(file_path='KJV.sqlite', path=Path('bibles'),
-                                 **{'session.close': mocked_close})
+                                 **{'session.close': mocked_close, 'session.get_bind.return_value': mocked_engine})
         instance.db_cache = {'KJV': mocked_bible}
 
         # WHEN: Calling delete_bible with 'KJV'
         result = instance.delete_bible('KJV')
 
-        # THEN: The session should have been closed and set to None, the bible should be deleted, and the result of
-        #       the deletion returned.
+        # THEN: The session should have been closed and set to None, the engine disposed of, the bible should be
+        #       deleted, and the result of the deletion returned.
         assert result is True
         mocked_close.assert_called_once_with()
+        mocked_engine.dispose.assert_called_once_with()
         assert mocked_bible.session is None
         mocked_delete_file.assert_called_once_with(Path('bibles') / 'KJV.sqlite')
+
+
+def test_get_language_selection_is_cached(settings):
+    """
+    Test that the BibleManager get_language_selection method only reads the bible's book name language once, until the
+    meta data is saved
+    """
+    # GIVEN: An instance of BibleManager and a mocked bible with a book name language
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+        mocked_bible = MagicMock()
+        instance.db_cache = {'KJV': mocked_bible}
+        with patch.object(instance, 'get_meta_data', return_value=MagicMock(value='2')) as mocked_get_meta_data:
+
+            # WHEN: Calling get_language_selection twice, saving the meta data and calling it again
+            first_selection = instance.get_language_selection('KJV')
+            second_selection = instance.get_language_selection('KJV')
+            instance.save_meta_data('KJV', 'KJV', '', '', '', '2')
+            instance.get_language_selection('KJV')
+
+        # THEN: The book name language should only be read again after the meta data has been saved
+        assert first_selection == 2
+        assert second_selection == 2
+        assert mocked_get_meta_data.call_count == 2
+
+
+def test_process_verse_range(settings):
+    """
+    Test that the BibleManager process_verse_range method splits a range into one range per chapter
+    """
+    # GIVEN: An instance of BibleManager
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+
+        # WHEN: Calling process_verse_range with a range over three chapters, and one within a chapter
+        verse_ranges = instance.process_verse_range(1, 1, 5, 3, 10)
+        single_chapter_range = instance.process_verse_range(1, 2, 3, 2, 8)
+
+    # THEN: The first and last chapters should start and end at the given verses
+    assert verse_ranges == [(1, 1, 5, -1), (1, 2, 1, -1), (1, 3, 1, 10)]
+    assert single_chapter_range == [(1, 2, 3, 8)]
+
+
+def test_load_model(settings):
+    """
+    Test that the BibleManager load_model method creates and loads the model with the class for its library
+    """
+    # GIVEN: An instance of BibleManager and a downloaded model in the models database
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+    mocked_model_class = MagicMock()
+    db_model = MagicMock(path='models/tiny', download_source='https://example.com/tiny.pt',
+                         meta={'display_name': 'Tiny'}, **{'library.model_class': mocked_model_class})
+    db_model.name = 'tiny'
+    instance.model_manager = MagicMock(**{'get_object_filtered.return_value': db_model})
+
+    # WHEN: Loading the model
+    model = instance.load_model('tiny')
+
+    # THEN: The model should have been created with its saved details and loaded
+    mocked_model_class.assert_called_once_with('tiny', instance, path=Path('models/tiny'),
+                                               url='https://example.com/tiny.pt', display_name='Tiny')
+    model.load.assert_called_once_with()
+    assert model is mocked_model_class.return_value
+
+
+def test_load_model_reuses_loaded_model(settings):
+    """
+    Test that the BibleManager load_model method returns a model which is already loaded, until it is unloaded
+    """
+    # GIVEN: An instance of BibleManager with a loaded model
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+    mocked_model = MagicMock()
+    instance.loaded_models = {'tiny': mocked_model}
+    instance.model_manager = MagicMock()
+
+    # WHEN: Loading the model, then unloading it
+    model = instance.load_model('tiny')
+    instance.unload_model('tiny')
+
+    # THEN: The loaded model should have been returned without using the models database, and then destroyed
+    assert model is mocked_model
+    assert instance.model_manager.get_object_filtered.called is False
+    mocked_model.destroy.assert_called_once_with()
+    assert instance.loaded_models == {}
+
+
+def test_save_model_unloads_model(settings):
+    """
+    Test that the BibleManager save_model method unloads the saved model, so it is loaded again from its new details
+    """
+    # GIVEN: An instance of BibleManager with a loaded model, which has been downloaded to a new location
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+    loaded_model = MagicMock()
+    instance.loaded_models = {'tiny': loaded_model}
+    instance.model_manager = MagicMock(**{'get_object_filtered.return_value': None})
+    downloaded_model = MagicMock(path=Path('new', 'tiny'), url='https://example.com/tiny.pt', model_info={})
+    downloaded_model.name = 'tiny'
+
+    # WHEN: Saving the downloaded model
+    with patch('openlp.plugins.bibles.lib.manager.ModelInfo.get_model_info'):
+        instance.save_model(downloaded_model)
+
+    # THEN: The model should have been saved, and the old instance unloaded
+    instance.model_manager.save_object.assert_called_once()
+    loaded_model.destroy.assert_called_once_with()
+    assert instance.loaded_models == {}
+
+
+def test_get_models_is_cached(settings):
+    """
+    Test that the BibleManager get_models method only queries the models database once for each kind of model
+    """
+    # GIVEN: An instance of BibleManager with a mocked models database
+    with patch.object(BibleManager, 'reload_bibles'):
+        instance = BibleManager(MagicMock())
+    db_model = MagicMock()
+    db_model.name = 'tiny'
+    instance.model_manager = MagicMock(**{'get_all_objects.return_value': [db_model]})
+
+    # WHEN: Getting the downloaded models twice
+    first_models = instance.get_models()
+    second_models = instance.get_models()
+
+    # THEN: The models database should only have been queried once
+    assert first_models == ['tiny']
+    assert second_models == ['tiny']
+    instance.model_manager.get_all_objects.assert_called_once()
+
+
+def test_model_manager_is_created_on_first_use(settings):
+    """
+    Test that the BibleManager only opens the models database when the model manager is first used
+    """
+    # GIVEN: An instance of BibleManager with a mocked DBManager
+    with patch.object(BibleManager, 'reload_bibles'), \
+            patch('openlp.plugins.bibles.lib.manager.DBManager') as MockedDBManager:
+        instance = BibleManager(MagicMock())
+
+        # WHEN: Using the model manager twice
+        created_before_use = MockedDBManager.called
+        first_manager = instance.model_manager
+        second_manager = instance.model_manager
+
+    # THEN: The models database should have been opened once on first use, and the same manager returned both times
+    assert created_before_use is False
+    MockedDBManager.assert_called_once()
+    assert first_manager is second_manager is MockedDBManager.return_value
@@ -0,0 +1,370 @@
+# -*- coding: utf-8 -*-
+
+##########################################################################
+# OpenLP - Open Source Lyrics Projection                                 #
+# ---------------------------------------------------------------------- #
+# Copyright (c) 2008-2024 OpenLP Developers                              #
+# ---------------------------------------------------------------------- #
+# This program is free software: you can redistribute it and/or modify   #
+# it under the terms of the GNU General Public License as published by   #
+# the Free Software Foundation, either version 3 of the License, or      #
+# (at your option) any later version.                                    #
+#                                                                        #
+# This program is distributed in the hope that it will be useful,        #
+# but WITHOUT ANY WARRANTY; without even the implied warranty of         #
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the          #
+# GNU General Public License for more details.                           #
+#                                                                        #
+# You should have received a copy of the GNU General Public License      #
+# along with this program.  If not, see <https://www.gnu.org/licenses/>. #
+##########################################################################
+"""
+This module contains tests for the model submodule of the Bibles plugin.
+"""
+import hashlib
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from openlp.plugins.bibles.lib.model import ModelBase, ModelDownloadWorker
+
+
+URL = 'https://example.com/models/model.bin'
+CONTENT = bytes(range(256)) * 4
+
+
+class FakeResponse(object):
+    """
+    A streamed response from the mocked download session
+    """
+    def __init__(self, status_code=200, content=b'', headers=None, error_after=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = content
+        self.headers = headers or {}
+        self.url = URL
+        self.error_after = error_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def close(self):
+        pass
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise requests.exceptions.HTTPError(str(self.status_code))
+
+    def iter_content(self, chunk_size):
+        if self.error_after is not None:
+            yield self.content[:self.error_after]
+            raise requests.exceptions.ChunkedEncodingError('Connection broken')
+        yield self.content
+
+
+def serve(content, headers=None):
+    """
+    Serve ``content`` from the mocked download session, answering ranged requests with just the range asked for
+    """
+    def get(url, headers=None, **kwargs):
+        if headers and 'Range' in headers:
+            start, end = headers['Range'][len('bytes='):].split('-')
+            end = int(end) + 1 if end else len(content)
+            return FakeResponse(206, content[int(start):end])
+        return FakeResponse(200, content, dict(response_headers))
+    response_headers = headers or {}
+    return get
+
+
+@pytest.fixture
+def model(registry, tmp_path):
+    """A model which downloads into a temporary folder"""
+    with patch('openlp.plugins.bibles.lib.model.get_proxy_settings', return_value=None):
+        yield ModelBase('test', path=tmp_path, url=URL)
+
+
+@pytest.fixture
+def mocked_session():
+    """A mocked download session which supports ranged requests"""
+    session = MagicMock()
+    session.head.return_value = FakeResponse(headers={'Accept-Ranges': 'bytes', 'Content-Length': str(len(CONTENT)),
+                                                      'ETag': '"v1"'})
+    session.get.side_effect = serve(CONTENT, {'ETag': '"v1"'})
+    with patch('openlp.plugins.bibles.lib.model.get_download_session', return_value=session), \
+            patch('openlp.plugins.bibles.lib.model.PARALLEL_DOWNLOAD_MIN_BYTES', 1):
+        yield session
+
+
+@pytest.mark.parametrize('stop_before, stop_during, error, expected', [
+    (False, False, None, True),
+    (False, False, OSError('Disk full'), False),
+    (True, False, None, False),
+    (False, True, None, False)
+])
+def test_model_download_worker_start(stop_before, stop_during, error, expected):
+    """
+    Test that ModelDownloadWorker.start reports whether the model was downloaded, and always quits
+    """
+    # GIVEN: A worker for a model whose download succeeds, fails, or is stopped before or during the download
+    model = MagicMock(stop_import_flag=stop_before)
+
+    def download():
+        if error:
+            raise error
+        model.stop_import_flag = stop_during
+
+    model.download.side_effect = download
+    worker = ModelDownloadWorker(model)
+    finished = []
+    quit = MagicMock()
+    worker.download_finished.connect(finished.append)
+    worker.quit.connect(quit)
+
+    # WHEN: Running the worker
+    worker.start()
+
+    # THEN: The result should be reported once, the model only downloaded when it was not stopped first, and the
+    #       worker should always quit
+    assert finished == [expected]
+    assert model.download.called is not stop_before
+    quit.assert_called_once_with()
+
+
+def test_download_file_in_parts(model, mocked_session, tmp_path):
+    """
+    Test that a large file is downloaded in several ranged requests, which are put back together in order
+    """
+    # GIVEN: A server which supports ranged requests
+    file_path = tmp_path / 'model.bin'
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: Each part should have been asked for once, for the same version of the file, and put in its place
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    assert not (tmp_path / 'model.bin.part').exists()
+    assert sorted(kwargs['headers']['Range'] for _, kwargs in mocked_session.get.call_args_list) == \
+        ['bytes=0-255', 'bytes=256-511', 'bytes=512-767', 'bytes=768-1023']
+    assert all(kwargs['headers']['If-Range'] == '"v1"' for _, kwargs in mocked_session.get.call_args_list)
+
+
+def test_download_file_in_parts_retries_broken_part(model, mocked_session, tmp_path):
+    """
+    Test that a part whose connection breaks is carried on from where it got to
+    """
+    # GIVEN: A server which drops the connection part way through the first part, the first time
+    file_path = tmp_path / 'model.bin'
+    serve_content = mocked_session.get.side_effect
+    broken = []
+
+    def get(url, headers=None, **kwargs):
+        if headers['Range'] == 'bytes=0-255' and not broken:
+            broken.append(True)
+            return FakeResponse(206, CONTENT[:256], error_after=100)
+        return serve_content(url, headers=headers, **kwargs)
+
+    mocked_session.get.side_effect = get
+
+    # WHEN: Downloading the file
+    with patch('openlp.plugins.bibles.lib.model.time.sleep') as mocked_sleep:
+        result = model.download_file(URL, file_path)
+
+    # THEN: The rest of the broken part should have been asked for after a short wait, and the file put together
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    assert {'Range': 'bytes=100-255', 'If-Range': '"v1"'} in \
+        [kwargs['headers'] for _, kwargs in mocked_session.get.call_args_list]
+    mocked_sleep.assert_called_once_with(2)
+
+
+def test_download_file_in_parts_stopped(model, mocked_session, tmp_path):
+    """
+    Test that stopping the import stops a download in parts
+    """
+    # GIVEN: An import which has been stopped
+    file_path = tmp_path / 'model.bin'
+    model.stop_import_flag = True
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: The download should report that it did not finish, without a single request fallback
+    assert result is False
+    assert not file_path.exists()
+    assert all('Range' in kwargs['headers'] for _, kwargs in mocked_session.get.call_args_list)
+
+
+def test_download_file_in_parts_falls_back_when_file_changes(model, mocked_session, tmp_path):
+    """
+    Test that the file is downloaded with a single request when the server sends the whole file for a part
+    """
+    # GIVEN: A server which ignores If-Range, as it does when the file changed or its ETag is weak
+    file_path = tmp_path / 'model.bin'
+    mocked_session.get.side_effect = lambda url, headers=None, **kwargs: FakeResponse(200, CONTENT, {'ETag': 'W/"v2"'})
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: The file should have been downloaded with a single request instead
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    assert mocked_session.get.call_args_list[-1].kwargs['headers'] == {}
+
+
+@pytest.mark.parametrize('head_headers, min_bytes', [
+    ({'Content-Length': str(len(CONTENT))}, 1),
+    ({'Accept-Ranges': 'bytes', 'Content-Length': str(len(CONTENT))}, len(CONTENT) + 1)
+])
+def test_download_file_single_request(model, mocked_session, tmp_path, head_headers, min_bytes):
+    """
+    Test that a file is downloaded with a single request when the server can't send parts, or the file is small
+    """
+    # GIVEN: A server without ranged requests, or a file smaller than the size downloaded in parts
+    file_path = tmp_path / 'model.bin'
+    mocked_session.head.return_value = FakeResponse(headers=head_headers)
+
+    # WHEN: Downloading the file
+    with patch('openlp.plugins.bibles.lib.model.PARALLEL_DOWNLOAD_MIN_BYTES', min_bytes):
+        result = model.download_file(URL, file_path)
+
+    # THEN: The whole file should have been downloaded with one request
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    mocked_session.get.assert_called_once()
+    assert mocked_session.get.call_args.kwargs['headers'] == {}
+
+
+def partly_download(tmp_path, content, validator='"v1"'):
+    """
+    Leave a partly downloaded file, with the validator it was downloaded with
+    """
+    (tmp_path / 'model.bin.part').write_bytes(content)
+    (tmp_path / 'model.bin.meta.json').write_text(json.dumps({'url': URL, 'validator': validator}))
+
+
+def test_download_file_resumes(model, mocked_session, tmp_path):
+    """
+    Test that a partly downloaded file is resumed with a ranged request, and the rest appended to it
+    """
+    # GIVEN: A partly downloaded file
+    file_path = tmp_path / 'model.bin'
+    partly_download(tmp_path, CONTENT[:300])
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: Only the rest of the same version of the file should have been asked for, and added to the end
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    assert mocked_session.get.call_args.kwargs['headers'] == {'Range': 'bytes=300-', 'If-Range': '"v1"'}
+    assert not (tmp_path / 'model.bin.part').exists()
+    assert not (tmp_path / 'model.bin.meta.json').exists()
+    mocked_session.head.assert_not_called()
+
+
+def test_download_file_restarts_changed_file(model, mocked_session, tmp_path):
+    """
+    Test that a partly downloaded file is replaced when the remote file has changed
+    """
+    # GIVEN: A partly downloaded file, and a server which sends the whole of a newer version of the file, but drops the
+    #        connection part way through
+    file_path = tmp_path / 'model.bin'
+    partly_download(tmp_path, b'old')
+    mocked_session.get.side_effect = \
+        lambda url, headers=None, **kwargs: FakeResponse(200, CONTENT, {'ETag': '"v2"'}, error_after=100)
+
+    # WHEN: Downloading the file
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        model.download_file(URL, file_path)
+
+    # THEN: The old part should have been overwritten, and the new validator saved for resuming the new version
+    assert (tmp_path / 'model.bin.part').read_bytes() == CONTENT[:100]
+    assert json.loads((tmp_path / 'model.bin.meta.json').read_text()) == {'url': URL, 'validator': '"v2"'}
+
+
+def test_download_file_stopped_keeps_part(model, mocked_session, tmp_path):
+    """
+    Test that stopping a resumed download keeps what has been downloaded, so it can be resumed later
+    """
+    # GIVEN: A partly downloaded file, and an import which has been stopped
+    file_path = tmp_path / 'model.bin'
+    partly_download(tmp_path, CONTENT[:300])
+    model.stop_import_flag = True
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: The partly downloaded file and its validator should have been kept
+    assert result is False
+    assert not file_path.exists()
+    assert (tmp_path / 'model.bin.part').read_bytes() == CONTENT[:300]
+    assert (tmp_path / 'model.bin.meta.json').exists()
+
+
+def test_download_file_restarts_complete_part(model, mocked_session, tmp_path):
+    """
+    Test that a download is started again when the server can't send the rest of a file which is already complete
+    """
+    # GIVEN: A complete file which was not renamed, and a server which refuses to send the range after its end
+    file_path = tmp_path / 'model.bin'
+    partly_download(tmp_path, CONTENT)
+    serve_content = mocked_session.get.side_effect
+
+    def get(url, headers=None, **kwargs):
+        if headers and headers.get('Range') == 'bytes={size}-'.format(size=len(CONTENT)):
+            return FakeResponse(416)
+        return serve_content(url, headers=headers, **kwargs)
+
+    mocked_session.get.side_effect = get
+
+    # WHEN: Downloading the file
+    result = model.download_file(URL, file_path)
+
+    # THEN: The old files should have been removed and the file downloaded again
+    assert result is True
+    assert file_path.read_bytes() == CONTENT
+    assert not (tmp_path / 'model.bin.part').exists()
+    assert not (tmp_path / 'model.bin.meta.json').exists()
+
+
+def test_finish_download_checks_checksum(model, tmp_path):
+    """
+    Test that a downloaded file which matches the SHA-256 checksum in its URL is moved into place
+    """
+    # GIVEN: A downloaded file, from a URL with the file's checksum in its path
+    part_path = tmp_path / 'model.pt.part'
+    file_path = tmp_path / 'model.pt'
+    part_path.write_bytes(CONTENT)
+    url = 'https://example.com/models/{sha256}/model.pt'.format(sha256=hashlib.sha256(CONTENT).hexdigest())
+
+    # WHEN: Finishing the download
+    model._finish_download(url, part_path, file_path)
+
+    # THEN: The file should have been moved into place
+    assert file_path.read_bytes() == CONTENT
+    assert not part_path.exists()
+
+
+def test_finish_download_deletes_mismatched_file(model, tmp_path):
+    """
+    Test that a downloaded file which does not match the SHA-256 checksum in its URL is deleted
+    """
+    # GIVEN: A downloaded file, from a URL with a different checksum in its path
+    part_path = tmp_path / 'model.pt.part'
+    file_path = tmp_path / 'model.pt'
+    part_path.write_bytes(CONTENT)
+    url = 'https://example.com/models/{sha256}/model.pt'.format(sha256=hashlib.sha256(b'other').hexdigest())
+
+    # WHEN: Finishing the download
+    with pytest.raises(ValueError):
+        model._finish_download(url, part_path, file_path)
+
+    # THEN: The file should have been deleted, so that it is downloaded again
+    assert not part_path.exists()
+    assert not file_path.exists()